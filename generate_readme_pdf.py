@@ -8,40 +8,45 @@ Usage:
     python generate_readme_pdf.py
 """
 
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import letter
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak
-from reportlab.platypus import Table, TableStyle
-from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_JUSTIFY
+import hashlib
+import os
 import re
+import sys
+from functools import lru_cache
 
+# Set POSITRON_PDF_DEBUG=1 to keep ReportLab's shape checking while authoring styles
+DEBUG = bool(os.environ.get('POSITRON_PDF_DEBUG'))
 
-def markdown_to_pdf(md_file, pdf_file):
-    """Convert markdown README to PDF with basic formatting."""
+# Output buffer size for the generated PDF
+_PDF_WRITE_BUFFER = 1024 * 1024
+
+# Inline markdown patterns, compiled once for the per-line loop
+_NUM_RE = re.compile(r'^\d+\.\s')
+_INLINE_RE = re.compile(r'\*\*([^\*]+)\*\*|`([^`]+)`')
+_CODE_RE = re.compile(r'`([^`]+)`')
+_LINK_RE = re.compile(r'\[([^\]]+)\]\([^\)]+\)')
+
+
+@lru_cache(maxsize=None)
+def _get_styles():
+    """
+    Build the paragraph styles used for the manual.
     
-    # Read the markdown file
-    with open(md_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Create PDF document
-    doc = SimpleDocTemplate(
-        pdf_file,
-        pagesize=letter,
-        rightMargin=0.75*inch,
-        leftMargin=0.75*inch,
-        topMargin=0.75*inch,
-        bottomMargin=0.75*inch
-    )
+    The styles are pure constants, so they are built once and cached. ReportLab
+    is imported here rather than at module level so an up-to-date PDF never
+    pays for loading it.
+    """
+    from reportlab import rl_config
+    from reportlab.lib import colors
+    from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
     
-    # Container for the 'Flowable' objects
-    elements = []
+    if not DEBUG:
+        # Skip per-attribute shape validation on every flowable
+        rl_config.shapeChecking = 0
     
-    # Define styles
     styles = getSampleStyleSheet()
     
-    # Custom styles
     title_style = ParagraphStyle(
         'CustomTitle',
         parent=styles['Heading1'],
@@ -90,6 +95,12 @@ def markdown_to_pdf(md_file, pdf_file):
         spaceAfter=6
     )
     
+    body_bold_style = ParagraphStyle(
+        'CustomBodyBold',
+        parent=body_style,
+        fontName='Helvetica-Bold'
+    )
+    
     code_style = ParagraphStyle(
         'Code',
         parent=styles['Code'],
@@ -110,108 +121,207 @@ def markdown_to_pdf(md_file, pdf_file):
         spaceAfter=4
     )
     
-    # Process the markdown content
-    lines = content.split('\n')
-    i = 0
-    
-    while i < len(lines):
-        line = lines[i].strip()
-        
-        # Skip empty lines
-        if not line:
-            i += 1
-            continue
-        
-        # Main title (first # line)
-        if line.startswith('# ') and i < 5:  # Only first few lines
-            title_text = line[2:].strip()
-            elements.append(Paragraph(title_text, title_style))
-            elements.append(Spacer(1, 0.2*inch))
-            i += 1
-            continue
-        
-        # H3 headers (###)
-        if line.startswith('### '):
-            header_text = line[4:].strip()
-            elements.append(Paragraph(header_text, h3_style))
-            i += 1
-            continue
-        
-        # H2 headers (##)
-        if line.startswith('## '):
-            header_text = line[3:].strip()
-            elements.append(Paragraph(header_text, h2_style))
-            i += 1
-            continue
-        
-        # H1 headers (#)
-        if line.startswith('# '):
-            header_text = line[2:].strip()
-            elements.append(Paragraph(header_text, h1_style))
-            i += 1
-            continue
-        
-        # Horizontal rules
-        if line.startswith('---'):
-            elements.append(Spacer(1, 0.2*inch))
-            i += 1
-            continue
-        
-        # Bold text markers
-        if line.startswith('**') and line.endswith('**'):
-            text = line[2:-2]
-            elements.append(Paragraph(f'<b>{text}</b>', body_style))
-            i += 1
-            continue
-        
-        # Bullet points
-        if line.startswith('- ') or line.startswith('* '):
-            bullet_text = line[2:].strip()
-            # Clean up markdown formatting
-            bullet_text = re.sub(r'\*\*([^\*]+)\*\*', r'<b>\1</b>', bullet_text)
-            bullet_text = re.sub(r'`([^`]+)`', r'<font name="Courier">\1</font>', bullet_text)
-            elements.append(Paragraph(f'• {bullet_text}', bullet_style))
-            i += 1
-            continue
-        
-        # Numbered lists
-        if re.match(r'^\d+\.\s', line):
-            list_text = re.sub(r'^\d+\.\s', '', line)
-            list_text = re.sub(r'\*\*([^\*]+)\*\*', r'<b>\1</b>', list_text)
-            list_text = re.sub(r'`([^`]+)`', r'<font name="Courier">\1</font>', list_text)
-            elements.append(Paragraph(f'{line[:3]} {list_text}', bullet_style))
-            i += 1
-            continue
-        
-        # Code blocks (```)
-        if line.startswith('```'):
-            i += 1
-            code_lines = []
-            while i < len(lines) and not lines[i].strip().startswith('```'):
-                code_lines.append(lines[i])
-                i += 1
-            if code_lines:
-                code_text = '\n'.join(code_lines)
-                # Escape special characters
-                code_text = code_text.replace('<', '&lt;').replace('>', '&gt;')
-                elements.append(Paragraph(f'<font name="Courier">{code_text}</font>', code_style))
-            i += 1
-            continue
-        
-        # Regular paragraphs
-        if line:
-            # Clean up markdown formatting
-            text = re.sub(r'\*\*([^\*]+)\*\*', r'<b>\1</b>', line)
-            text = re.sub(r'`([^`]+)`', r'<font name="Courier">\1</font>', text)
-            # Convert markdown links to text
-            text = re.sub(r'\[([^\]]+)\]\([^\)]+\)', r'\1', text)
-            elements.append(Paragraph(text, body_style))
-        
-        i += 1
-    
-    # Build PDF
-    doc.build(elements)
+    return {
+        'title': title_style,
+        'h1': h1_style,
+        'h2': h2_style,
+        'h3': h3_style,
+        'body': body_style,
+        'body_bold': body_bold_style,
+        'code': code_style,
+        'bullet': bullet_style,
+    }
+
+
+def _inline_markup(match):
+    """Translate one **bold** or `code` span into ReportLab markup."""
+    bold_text, code_text = match.groups()
+    if bold_text is not None:
+        return '<b>' + _CODE_RE.sub(r'<font name="Courier">\1</font>', bold_text) + '</b>'
+    return f'<font name="Courier">{code_text}</font>'
+
+
+def _format_inline(text):
+    """Convert inline bold and code spans in a single regex pass."""
+    return _INLINE_RE.sub(_inline_markup, text)
+
+
+def _source_digest(md_file):
+    """Hash the markdown source together with this script (the PDF is a pure function of both)."""
+    with open(md_file, 'rb') as f:
+        md_bytes = f.read()
+    with open(__file__, 'rb') as f:
+        script_bytes = f.read()
+    return hashlib.blake2b(md_bytes + script_bytes, digest_size=16).hexdigest()
+
+
+class _Flowables:
+    """Flowables collected for the manual, plus what the line handlers need to build them."""
+    
+    def __init__(self, paragraph_cls, styles, section_spacer):
+        self.paragraph = paragraph_cls
+        self.styles = styles
+        # Spacers carry no per-use state, so one instance is shared by every
+        # title and horizontal rule
+        self.section_spacer = section_spacer
+        # Container for the 'Flowable' objects
+        self.elements = []
+    
+    def add(self, text, style_name):
+        self.elements.append(self.paragraph(text, self.styles[style_name]))
+
+
+def _handle_header(line, line_number, lines, flow):
+    """Title and H1-H3 headers; anything else starting with '#' is body text.
+    
+    Like every line handler, returns how many further lines it read from lines.
+    """
+    # Main title (first # line)
+    if line.startswith('# ') and line_number < 5:  # Only first few lines
+        flow.add(line[2:].strip(), 'title')
+        flow.elements.append(flow.section_spacer)
+    elif line.startswith('### '):
+        flow.add(line[4:].strip(), 'h3')
+    elif line.startswith('## '):
+        flow.add(line[3:].strip(), 'h2')
+    elif line.startswith('# '):
+        flow.add(line[2:].strip(), 'h1')
+    else:
+        return _handle_paragraph(line, line_number, lines, flow)
+    return 0
+
+
+def _handle_bullet(line, line_number, lines, flow):
+    """Bullet points, plus the '---' rules and '**bold**' lines that share their first character."""
+    # Horizontal rules
+    if line.startswith('---'):
+        flow.elements.append(flow.section_spacer)
+    # Bold text markers
+    elif line.startswith('**') and line.endswith('**'):
+        flow.add(line[2:-2], 'body_bold')
+    elif line.startswith('- ') or line.startswith('* '):
+        # Clean up markdown formatting
+        bullet_text = _format_inline(line[2:].strip())
+        flow.add(f'• {bullet_text}', 'bullet')
+    else:
+        return _handle_paragraph(line, line_number, lines, flow)
+    return 0
+
+
+def _handle_numbered(line, line_number, lines, flow):
+    """Numbered list items."""
+    number_match = _NUM_RE.match(line)
+    if number_match is None:
+        return _handle_paragraph(line, line_number, lines, flow)
+    list_text = _format_inline(line[number_match.end():])
+    flow.add(f'{line[:3]} {list_text}', 'bullet')
+    return 0
+
+
+def _handle_code_fence(line, line_number, lines, flow):
+    """Code blocks (```) - consume lines from the same iterator up to the closing fence."""
+    if not line.startswith('```'):
+        return _handle_paragraph(line, line_number, lines, flow)
+    consumed = 0
+    code_lines = []
+    for code_line in lines:
+        consumed += 1
+        if code_line.strip().startswith('```'):
+            break
+        code_lines.append(code_line.rstrip('\n'))
+    if code_lines:
+        code_text = '\n'.join(code_lines)
+        # Escape special characters
+        code_text = code_text.replace('<', '&lt;').replace('>', '&gt;')
+        # The code style is already Courier, so no inline <font> markup is needed
+        flow.add(code_text, 'code')
+    return consumed
+
+
+def _handle_paragraph(line, line_number, lines, flow):
+    """Regular paragraphs."""
+    # Clean up markdown formatting
+    text = _format_inline(line)
+    # Convert markdown links to text
+    text = _LINK_RE.sub(r'\1', text)
+    flow.add(text, 'body')
+    return 0
+
+
+# Line handlers keyed on the first character of the stripped line
+_DISPATCH = {
+    '#': _handle_header,
+    '-': _handle_bullet,
+    '*': _handle_bullet,
+    '`': _handle_code_fence,
+    **dict.fromkeys('0123456789', _handle_numbered),
+}
+
+
+def markdown_to_pdf(md_file, pdf_file):
+    """Convert markdown README to PDF with basic formatting."""
+    
+    # Inside a PyInstaller bundle the manual is already baked in next to the
+    # executable, so never try to rebuild it at runtime
+    if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
+        return os.path.join(sys._MEIPASS, pdf_file)
+    
+    # Cheap dev-time check: a PDF newer than both of its inputs is current
+    if os.path.exists(pdf_file):
+        pdf_mtime = os.path.getmtime(pdf_file)
+        if pdf_mtime > os.path.getmtime(md_file) and pdf_mtime > os.path.getmtime(__file__):
+            print(f"PDF is up to date: {pdf_file}")
+            return pdf_file
+    
+    # Otherwise skip the rebuild if the PDF was generated from identical inputs
+    stamp_file = pdf_file + '.stamp'
+    digest = _source_digest(md_file)
+    if os.path.exists(pdf_file) and os.path.exists(stamp_file):
+        with open(stamp_file, 'r', encoding='utf-8') as f:
+            if f.read().strip() == digest:
+                print(f"PDF is up to date: {pdf_file}")
+                return pdf_file
+    
+    # ReportLab is only needed when the PDF is actually rebuilt
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.units import inch
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+    
+    flow = _Flowables(Paragraph, _get_styles(), Spacer(1, 0.2*inch))
+    
+    # Process the markdown file line by line (file objects are buffered line
+    # iterators, so the whole README is never held in memory at once). The
+    # first character picks the handler, so each line costs one dict lookup
+    # instead of a chain of startswith() probes. Handlers may read further
+    # lines from f (code blocks), so the line number is counted explicitly.
+    with open(md_file, 'r', encoding='utf-8') as f:
+        line_number = 0
+        for raw_line in f:
+            line = raw_line.strip()
+            
+            # Skip empty lines
+            if line:
+                line_number += _DISPATCH.get(line[0], _handle_paragraph)(line, line_number, f, flow)
+            line_number += 1
+    
+    # Build PDF into a 1 MiB buffered handle so ReportLab's many small
+    # writes are coalesced into a few large ones
+    with open(pdf_file, 'wb', buffering=_PDF_WRITE_BUFFER) as fh:
+        doc = SimpleDocTemplate(
+            fh,
+            pagesize=letter,
+            rightMargin=0.75*inch,
+            leftMargin=0.75*inch,
+            topMargin=0.75*inch,
+            bottomMargin=0.75*inch
+        )
+        doc.build(flow.elements)
+    
+    with open(stamp_file, 'w', encoding='utf-8') as f:
+        f.write(digest)
+    
     print(f"PDF generated successfully: {pdf_file}")
+    return pdf_file
 
 
 if __name__ == '__main__':
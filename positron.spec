@@ -43,6 +43,9 @@ a = Analysis(
         'numpy.core',
         'numpy.core._multiarray_umath',
         
+        # Config file serialization (optional at runtime, imported in a try block)
+        'orjson',
+        
         # PicoSDK modules - include all potential scope types
         'picosdk',
         'picosdk.ps3000a',
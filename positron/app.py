@@ -11,23 +11,30 @@ This is NOT the entry point - see main.py for application startup.
 """
 
 import sys
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional, Any
+from typing import TYPE_CHECKING, Iterator, Optional, Any
 
 from PySide6.QtWidgets import QApplication
 from PySide6.QtCore import QObject, Signal
 
 from positron.config import AppConfig, ChannelCalibration
-from positron.scope.connection import ScopeInfo
 from positron.processing.events import EventStorage, get_event_storage
 
+if TYPE_CHECKING:
+    # Only needed for annotations; importing the connection module loads picosdk
+    from positron.scope.connection import ScopeInfo
+
 
 class PositronApp(QObject):
     """
     Main application class managing the application lifecycle and configuration.
     """
     
-    # Signals for application-wide events
+    # Signals for application-wide events. They are emitted from inside state
+    # changes (connect_scope, save_config), so widgets that do UI work in
+    # response should connect with Qt.QueuedConnection and run on the next
+    # event-loop turn instead of stalling the emitter.
     config_changed = Signal()
     scope_connected_signal = Signal()
     scope_disconnected_signal = Signal()
@@ -53,9 +60,18 @@ class PositronApp(QObject):
         # Application state
         self._scope_connected = False
         self._scope_handle = None
-        self._scope_info: Optional[ScopeInfo] = None
+        self._scope_info: Optional['ScopeInfo'] = None
         self._acquisition_state = "stopped"  # "stopped", "running", "paused"
         
+        # save_config() batching (see defer_saves)
+        self._save_defer_depth = 0
+        self._save_pending = False
+        self._pending_save_path: Optional[Path] = None
+        
+        # Per-connection hardware configurators (created on first use)
+        self._configurator = None
+        self._trigger_configurator = None
+        
         # Initialize global event storage
         self._event_storage = get_event_storage(max_capacity=self.config.max_events)
     
@@ -65,7 +81,7 @@ class PositronApp(QObject):
         return self._scope_connected
     
     @property
-    def scope_info(self) -> Optional[ScopeInfo]:
+    def scope_info(self) -> Optional['ScopeInfo']:
         """Get information about the connected scope."""
         return self._scope_info
     
@@ -89,7 +105,7 @@ class PositronApp(QObject):
         if state in ("stopped", "running", "paused"):
             self._acquisition_state = state
     
-    def connect_scope(self, scope_info: ScopeInfo) -> None:
+    def connect_scope(self, scope_info: 'ScopeInfo') -> None:
         """
         Register a successful scope connection.
         
@@ -100,9 +116,11 @@ class PositronApp(QObject):
         self._scope_handle = scope_info.handle
         self._scope_connected = True
         
-        # Update configuration with detected scope
-        self.config.scope.scope_series = scope_info.series
-        self.save_config()
+        # Update configuration with detected scope (usually the same series as
+        # last run, in which case there is nothing to write)
+        if self.config.scope.scope_series != scope_info.series:
+            self.config.scope.scope_series = scope_info.series
+            self.save_config()
         
         # Emit connection signal
         self.scope_connected_signal.emit()
@@ -117,13 +135,77 @@ class PositronApp(QObject):
             self._scope_connected = False
             self._scope_handle = None
             self._scope_info = None
+            self._configurator = None
+            self._trigger_configurator = None
             self.scope_disconnected_signal.emit()
     
+    def get_configurator(self):
+        """
+        Get the scope configurator for the connected scope.
+        
+        The instance is created on first use and reused until the scope is
+        disconnected.
+        
+        Returns:
+            ScopeConfigurator for the connected scope series
+            
+        Raises:
+            RuntimeError: If no scope is connected
+        """
+        if self._configurator is None:
+            if self._scope_info is None:
+                raise RuntimeError("No scope connected. Call connect_scope() first.")
+            from positron.scope.configuration import create_configurator
+            self._configurator = create_configurator(self._scope_info)
+        return self._configurator
+    
+    def get_trigger_configurator(self):
+        """
+        Get the trigger configurator for the connected scope.
+        
+        The instance is created on first use and reused until the scope is
+        disconnected.
+        
+        Returns:
+            TriggerConfigurator for the connected scope series
+            
+        Raises:
+            RuntimeError: If no scope is connected
+        """
+        if self._trigger_configurator is None:
+            if self._scope_info is None:
+                raise RuntimeError("No scope connected. Call connect_scope() first.")
+            from positron.scope.trigger import create_trigger_configurator
+            self._trigger_configurator = create_trigger_configurator(self._scope_info)
+        return self._trigger_configurator
+    
     def save_config(self, path: Optional[Path] = None) -> None:
-        """Save current configuration to file."""
+        """Save current configuration to file (or queue it inside defer_saves)."""
+        if self._save_defer_depth:
+            self._save_pending = True
+            self._pending_save_path = path
+            return
+        
         self.config.save(path)
         self.config_changed.emit()
     
+    @contextmanager
+    def defer_saves(self) -> Iterator[None]:
+        """
+        Coalesce save_config() calls made inside the block into one write.
+        
+        The configuration is saved (and config_changed emitted) once when the
+        outermost block exits, and only if something asked for a save.
+        """
+        self._save_defer_depth += 1
+        try:
+            yield
+        finally:
+            self._save_defer_depth -= 1
+            if not self._save_defer_depth and self._save_pending:
+                self._save_pending = False
+                self.save_config(self._pending_save_path)
+    
     def get_config(self) -> AppConfig:
         """Get the current application configuration."""
         return self.config
@@ -156,18 +238,32 @@ class PositronApp(QObject):
             self.scope_disconnected_signal.emit()
 
 
+# QApplication created (or adopted) by create_application()
+_app_singleton: Optional[QApplication] = None
+
+
 def create_application() -> QApplication:
     """
     Create and configure the QApplication instance.
     
+    Repeated calls return the same instance without touching Qt again.
+    
     Returns:
         Configured QApplication instance
     """
+    global _app_singleton
+    if _app_singleton is not None:
+        return _app_singleton
+    
     app = QApplication.instance()
     if app is None:
         app = QApplication(sys.argv)
+        # Set the style before any widget exists so nothing has to be re-polished
+        app.setStyle('Fusion')  # Apply modern Qt style
         app.setApplicationName("Positron")
         app.setOrganizationName("Positron")
         app.setApplicationVersion("1.1.0")
     
+    _app_singleton = app
     return app
+
@@ -21,6 +21,9 @@ import numpy as np
 PEAK_1_KEV = 511.0   # Positron annihilation
 PEAK_2_KEV = 1275.0  # Na-22 gamma
 
+# Expected raw peak ratio for a linear detector response (~2.5)
+_EXPECTED_RATIO = PEAK_2_KEV / PEAK_1_KEV
+
 
 class CalibrationError(Exception):
     """Exception raised for calibration-related errors."""
@@ -86,6 +89,76 @@ def calculate_two_point_calibration(
     return gain, offset
 
 
+def calculate_two_point_calibration_batch(
+    peak_1_raw: np.ndarray,
+    peak_2_raw: np.ndarray,
+    peak_1_kev: float = PEAK_1_KEV,
+    peak_2_kev: float = PEAK_2_KEV
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate linear calibration parameters for several channels at once.
+    
+    Args:
+        peak_1_raw: Raw energy of the first peak for each channel (mV·ns)
+        peak_2_raw: Raw energy of the second peak for each channel (mV·ns)
+        peak_1_kev: Known energy of first peak (keV, default: 511)
+        peak_2_kev: Known energy of second peak (keV, default: 1275)
+        
+    Returns:
+        Tuple of (gain, offset) arrays, one entry per channel
+        
+    Raises:
+        CalibrationError: If any channel's peaks are too close or invalid
+            (the message describes the first such channel)
+    """
+    peak_1_raw = np.asarray(peak_1_raw, dtype=np.float64)
+    peak_2_raw = np.asarray(peak_2_raw, dtype=np.float64)
+    
+    # Validate inputs
+    bad = peak_2_raw <= peak_1_raw
+    if bad.any():
+        i = int(np.argmax(bad))
+        raise CalibrationError(
+            f"Peak 2 raw value ({peak_2_raw[i]:.2f}) must be greater than "
+            f"peak 1 raw value ({peak_1_raw[i]:.2f})"
+        )
+    
+    # Check minimum separation (at least 10% difference)
+    with np.errstate(divide='ignore'):
+        separation = (peak_2_raw - peak_1_raw) / peak_1_raw
+    bad = separation < 0.1
+    if bad.any():
+        i = int(np.argmax(bad))
+        raise CalibrationError(
+            f"Peaks are too close together (separation: {separation[i]*100:.1f}%). "
+            f"Need at least 10% separation for reliable calibration."
+        )
+    
+    # Calculate gain (slope)
+    gain = (peak_2_kev - peak_1_kev) / (peak_2_raw - peak_1_raw)
+    
+    # Calculate offset (intercept)
+    offset = peak_1_kev - gain * peak_1_raw
+    
+    # Validate gain is reasonable (should be positive and not too extreme)
+    bad = gain <= 0
+    if bad.any():
+        i = int(np.argmax(bad))
+        raise CalibrationError(
+            f"Invalid gain value: {gain[i]:.6f}. Gain must be positive."
+        )
+    
+    bad = (gain < 0.001) | (gain > 1000)
+    if bad.any():
+        i = int(np.argmax(bad))
+        raise CalibrationError(
+            f"Gain value {gain[i]:.6f} keV/(mV·ns) is outside reasonable range "
+            f"(0.001 to 1000). Check peak values."
+        )
+    
+    return gain, offset
+
+
 def find_peak_center_weighted_mean(
     energies: np.ndarray,
     region_min: float,
@@ -95,15 +168,20 @@ def find_peak_center_weighted_mean(
     """
     Find peak center using weighted mean (centroid) method.
     
-    This method calculates the "center of mass" of the histogram
+    This method calculates the "center of mass" of the events
     within the selected region, providing a robust estimate of
-    the peak center.
+    the peak center. The centroid of a uniformly binned histogram
+    equals the mean of its samples up to a bias well below the bin
+    width, so the samples are averaged directly in a single masked
+    reduction without building a histogram.
     
     Args:
-        energies: Array of raw energy values (mV·ns)
+        energies: Array of raw energy values (mV·ns). Expected to be a
+            C-contiguous float32 array; anything else is converted once
+            on entry.
         region_min: Minimum energy of region
         region_max: Maximum energy of region
-        num_bins: Number of histogram bins to use
+        num_bins: Unused; kept for backward compatibility
         
     Returns:
         Peak center location in raw energy units (mV·ns)
@@ -118,37 +196,30 @@ def find_peak_center_weighted_mean(
             f"min ({region_min:.2f})"
         )
     
-    # Filter energies to region
-    in_region = (energies >= region_min) & (energies <= region_max)
-    region_energies = energies[in_region]
+    # No-op for contiguous float32 input; otherwise one conversion up front
+    # instead of each operation below working on a strided/other-dtype view
+    energies = np.ascontiguousarray(energies, dtype=np.float32)
     
-    if len(region_energies) == 0:
+    # Count and sum the energies inside the region without copying them out
+    # (the mask is combined in place rather than allocating a third array)
+    in_region = energies >= region_min
+    in_region &= energies <= region_max
+    count = int(np.count_nonzero(in_region))
+    
+    if count == 0:
         raise CalibrationError(
             f"No events found in region [{region_min:.2f}, {region_max:.2f}]"
         )
     
-    if len(region_energies) < 10:
+    if count < 10:
         raise CalibrationError(
-            f"Too few events in region ({len(region_energies)}). "
+            f"Too few events in region ({count}). "
             f"Need at least 10 events for reliable peak finding."
         )
     
-    # Create histogram
-    hist, bin_edges = np.histogram(
-        region_energies,
-        bins=num_bins,
-        range=(region_min, region_max)
-    )
-    
-    # Calculate bin centers
-    bin_centers = (bin_edges[:-1] + bin_edges[1:]) / 2
-    
     # Calculate weighted mean (centroid)
-    total_counts = np.sum(hist)
-    if total_counts == 0:
-        raise CalibrationError("Histogram is empty in selected region")
-    
-    peak_center = np.sum(bin_centers * hist) / total_counts
+    total = np.sum(energies, where=in_region, dtype=np.float64)
+    peak_center = total / count
     
     return float(peak_center)
 
@@ -177,12 +248,11 @@ def validate_calibration_data(
     if events_count < min_events:
         return False, f"Need at least {min_events} events for calibration (have {events_count})"
     
-    # Check peaks are different
-    if abs(peak_2_raw - peak_1_raw) < 0.01:
-        return False, "Peaks are too similar - check region selection"
-    
-    # Check peak order
-    if peak_2_raw <= peak_1_raw:
+    # Check peaks are different and in order (one comparison on the valid path)
+    difference = peak_2_raw - peak_1_raw
+    if difference < 0.01:
+        if difference > -0.01:
+            return False, "Peaks are too similar - check region selection"
         return False, "Peak 2 must have higher energy than Peak 1"
     
     # Check peaks are positive
@@ -191,13 +261,12 @@ def validate_calibration_data(
     
     # Check separation ratio
     ratio = peak_2_raw / peak_1_raw
-    expected_ratio = PEAK_2_KEV / PEAK_1_KEV  # ~2.5
     
     # Allow ratio between 1.5 and 4.0 (reasonable range)
     if ratio < 1.5 or ratio > 4.0:
         return False, (
             f"Peak ratio ({ratio:.2f}) is outside expected range (1.5-4.0). "
-            f"Expected ratio is ~{expected_ratio:.2f} for Na-22. "
+            f"Expected ratio is ~{_EXPECTED_RATIO:.2f} for Na-22. "
             f"Check that you selected the correct peaks."
         )
     
@@ -212,6 +281,9 @@ def apply_calibration(
     """
     Apply calibration to convert raw energy to keV.
     
+    Arrays of raw energies are calibrated with
+    ChannelCalibration.apply_calibration_array.
+    
     Args:
         raw_energy: Raw energy in mV·ns
         gain: Calibration gain (keV per mV·ns)
@@ -244,14 +316,12 @@ def get_calibration_summary(
     peak_1_calib = apply_calibration(peak_1_raw, gain, offset)
     peak_2_calib = apply_calibration(peak_2_raw, gain, offset)
     
-    summary = [
-        "Calibration Summary:",
-        f"  Gain:   {gain:.6f} keV/(mV·ns)",
-        f"  Offset: {offset:.3f} keV",
-        "",
-        "Peak Verification:",
-        f"  511 keV peak:  raw={peak_1_raw:.2f} → calibrated={peak_1_calib:.1f} keV",
-        f"  1275 keV peak: raw={peak_2_raw:.2f} → calibrated={peak_2_calib:.1f} keV",
-    ]
-    
-    return "\n".join(summary)
+    return (
+        "Calibration Summary:\n"
+        f"  Gain:   {gain:.6f} keV/(mV·ns)\n"
+        f"  Offset: {offset:.3f} keV\n"
+        "\n"
+        "Peak Verification:\n"
+        f"  511 keV peak:  raw={peak_1_raw:.2f} → calibrated={peak_1_calib:.1f} keV\n"
+        f"  1275 keV peak: raw={peak_2_raw:.2f} → calibrated={peak_2_calib:.1f} keV"
+    )
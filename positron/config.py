@@ -2,12 +2,28 @@
 Configuration management for scope settings and application defaults.
 """
 
-from dataclasses import dataclass, field
-from typing import Optional, Dict, Any, List
+from dataclasses import MISSING, dataclass, field, fields
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime
 import json
+import os
 from pathlib import Path
 
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON encode/decode, stdlib json otherwise
+    orjson = None
+
+
+# Default file locations (resolved once at import; Path.home() consults the
+# environment/user database on every call)
+_HOME = Path.home()
+_DEFAULT_CONFIG_FILE = _HOME / ".positron" / "config.json"
+_DEFAULT_SAVE_DIR = _HOME / "Documents" / "Positron"
+
 
 @dataclass
 class ChannelCalibration:
@@ -58,6 +74,31 @@ class ChannelCalibration:
             Calibrated energy in keV
         """
         return self.gain * raw_energy + self.offset
+    
+    def apply_calibration_array(self, raw: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Apply calibration to an array of raw energies in one pass.
+        
+        Args:
+            raw: Raw energies in mV·ns
+            out: Optional array to write into (may be raw itself, to
+                calibrate a temporary in place); must match raw's shape and
+                the result dtype
+            
+        Returns:
+            Array of calibrated energies in keV (float32, or float64 if raw
+            is float64); out if given, otherwise a new array
+        """
+        raw = np.asarray(raw)
+        if raw.dtype != np.float64:
+            # float32 keeps plenty of precision for histogramming and halves
+            # the memory traffic of the full-store passes
+            raw = raw.astype(np.float32, copy=False)
+        if out is None:
+            out = np.empty_like(raw)
+        np.multiply(raw, raw.dtype.type(self.gain), out=out)
+        out += raw.dtype.type(self.offset)
+        return out
 
 
 @dataclass
@@ -82,7 +123,7 @@ class TriggerCondition:
         """Create from dictionary."""
         return cls(
             enabled=data.get("enabled", False),
-            channels=data.get("channels", [])
+            channels=list(data.get("channels", []))  # Copy: data may be a cached dict
         )
     
     def has_channels(self) -> bool:
@@ -210,11 +251,7 @@ class ScopeConfig:
     def from_dict(cls, data: Dict[str, Any]) -> "ScopeConfig":
         """Create configuration from dictionary."""
         # Filter out old/unknown fields for backward compatibility
-        valid_fields = {
-            "scope_series", "last_variant", "last_serial",
-            "waveform_length", "pre_trigger_samples", "sample_rate", "voltage_range_code", "timebase_index"
-        }
-        filtered_data = {k: v for k, v in data.items() if k in valid_fields}
+        filtered_data = {k: v for k, v in data.items() if k in _SCOPE_SCALAR_FIELDS}
         
         # Handle trigger config separately
         scope_config = cls(**filtered_data)
@@ -257,6 +294,45 @@ class ScopeConfig:
             return self.calibration_d
         else:
             raise ValueError(f"Invalid channel: {channel}. Must be A, B, C, or D.")
+    
+    def calibration_vector(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Snapshot the channel gains and offsets as arrays indexed A-D (0-3).
+        
+        Lets a block of raw energies with one column per channel be calibrated
+        with a single multiply-add. Built on each call, since calibrations are
+        updated in place by the calibration panel.
+        
+        Returns:
+            Tuple of (gains, offsets), float64 arrays of length 4
+        """
+        calibrations = [self.calibration_a, self.calibration_b, self.calibration_c, self.calibration_d]
+        gains = np.array([c.gain for c in calibrations], dtype=np.float64)
+        offsets = np.array([c.offset for c in calibrations], dtype=np.float64)
+        return gains, offsets
+
+
+# ScopeConfig fields passed straight to the constructor by from_dict (the
+# nested trigger/calibration objects, which use default factories, are
+# converted separately)
+_SCOPE_SCALAR_FIELDS = frozenset(
+    f.name for f in fields(ScopeConfig) if f.default_factory is MISSING
+)
+
+
+@lru_cache(maxsize=4)
+def _read_config_file(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    Parse a JSON configuration file.
+    
+    Cached on (path, modification time) so repeated loads of an unchanged file
+    skip the read and parse. The returned dict is shared between callers and
+    must not be mutated.
+    """
+    if orjson is not None:
+        return orjson.loads(Path(path).read_bytes())
+    with open(path, "r") as f:
+        return json.load(f)
 
 
 @dataclass
@@ -286,11 +362,16 @@ class AppConfig:
     event_limit_count: int = 10000  # Event count limit (default: 10,000 events)
     
     # File paths
-    config_file: Path = field(default_factory=lambda: Path.home() / ".positron" / "config.json")
-    default_save_directory: Path = field(default_factory=lambda: Path.home() / "Documents" / "Positron")
+    config_file: Path = _DEFAULT_CONFIG_FILE
+    default_save_directory: Path = _DEFAULT_SAVE_DIR
     
     def save(self, path: Optional[Path] = None) -> None:
-        """Save configuration to JSON file."""
+        """
+        Save configuration to JSON file.
+        
+        Args:
+            path: Destination file. If None, uses config_file.
+        """
         if path is None:
             path = self.config_file
         
@@ -311,22 +392,42 @@ class AppConfig:
             "max_events": self.max_events,
         }
         
-        with open(path, "w") as f:
-            json.dump(config_dict, f, indent=2)
+        if orjson is not None:
+            # Values computed with NumPy (sample rates, calibration results) may
+            # arrive as NumPy scalars, which orjson rejects without this option
+            data = orjson.dumps(
+                config_dict,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+            )
+        else:
+            data = json.dumps(config_dict, indent=2).encode()
+        
+        # Write to a temporary file and swap it in, so a crash mid-write cannot
+        # leave a truncated config (which load() would replace with defaults)
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        try:
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        
+        # The mtime may not change at coarse filesystem resolution, so drop
+        # any cached parse explicitly
+        _read_config_file.cache_clear()
     
     @classmethod
     def load(cls, path: Optional[Path] = None) -> "AppConfig":
         """Load configuration from JSON file."""
         if path is None:
-            path = cls().config_file
+            path = _DEFAULT_CONFIG_FILE
         
         if not path.exists():
             # Return default configuration if file doesn't exist
             return cls()
         
         try:
-            with open(path, "r") as f:
-                data = json.load(f)
+            data = _read_config_file(str(path), path.stat().st_mtime_ns)
             
             config = cls()
             config.scope = ScopeConfig.from_dict(data.get("scope", {}))
@@ -345,6 +446,7 @@ class AppConfig:
                 config.default_save_directory = Path(save_dir)
             
             return config
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError, so this covers both
         except (json.JSONDecodeError, KeyError, ValueError) as e:
             # Return default configuration on error
             print(f"Warning: Failed to load configuration: {e}. Using defaults.")
@@ -1,6 +1,27 @@
 """Analysis panel implementations."""
 
-from positron.panels.analysis.energy_display import EnergyDisplayPanel
-from positron.panels.analysis.timing_display import TimingDisplayPanel
+import importlib
 
-__all__ = ['EnergyDisplayPanel', 'TimingDisplayPanel']
\ No newline at end of file
+__all__ = ['EnergyDisplayPanel', 'TimingDisplayPanel']
+
+# Panels are imported on first access (PEP 562), so importing a submodule
+# such as utils does not pull in both panels and pyqtgraph
+_LAZY_EXPORTS = {
+    'EnergyDisplayPanel': 'positron.panels.analysis.energy_display',
+    'TimingDisplayPanel': 'positron.panels.analysis.timing_display',
+}
+
+
+def __getattr__(name):
+    """Import a panel class the first time it is accessed."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # Cache so __getattr__ is not consulted again
+    return value
+
+
+def __dir__():
+    """List the lazy exports alongside the loaded attributes."""
+    return sorted(set(globals()) | set(__all__))
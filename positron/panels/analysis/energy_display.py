@@ -9,34 +9,182 @@ Shows calibrated energy histograms for all 4 channels with:
 """
 
 import numpy as np
-from typing import Dict, Optional, Tuple
+from typing import Any, Dict, Optional, Tuple
 import csv
+from dataclasses import dataclass, replace
 from datetime import datetime
 from pathlib import Path
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QGroupBox,
     QLabel, QCheckBox, QRadioButton, QButtonGroup, QDoubleSpinBox,
-    QSpinBox, QPushButton, QSizePolicy, QFileDialog, QMessageBox
+    QSpinBox, QPushButton, QSizePolicy, QFileDialog, QMessageBox, QGraphicsItem
 )
-from PySide6.QtCore import Qt, QTimer, Signal
+from PySide6.QtCore import QObject, QRunnable, QSignalBlocker, QThreadPool, Qt, QTimer, Signal
 from PySide6.QtGui import QFont
 import pyqtgraph as pg
 
 from positron.app import PositronApp
+from positron.config import ChannelCalibration
+from positron.processing.events import CHANNEL_ROWS
 from positron.panels.analysis.utils import (
-    extract_calibrated_energies,
     get_channel_info,
+    uniform_histogram,
     CHANNEL_COLORS
 )
 
 
+@dataclass
+class HistogramResult:
+    """Energy histograms for the enabled channels on shared bin edges."""
+    event_count: int  # Number of stored events included
+    bin_edges: Optional[np.ndarray]  # None if no channel has any pulses yet
+    counts: Dict[str, np.ndarray]  # Counts per bin for each channel
+    event_counts: Dict[str, int]  # Number of pulses histogrammed for each channel
+
+
+class _HistogramTaskSignals(QObject):
+    """Signals for HistogramTask (QRunnable is not a QObject)."""
+    finished = Signal()
+
+
+class HistogramTask(QRunnable):
+    """
+    Computes energy histograms on a worker thread.
+    
+    Works on a snapshot of the event storage columns (rows already stored
+    are never rewritten, see EventStorage.get_columns) and on copies of the
+    channel calibrations, so the GUI thread is free while it runs. Given a
+    previous result, only events from that result's event_count on are
+    added to it; otherwise, or when new events fall outside an automatic
+    range, all events are histogrammed again.
+    
+    The outcome is stored on the task (result or error) and announced with
+    signals.finished, which is delivered on the GUI thread.
+    """
+    
+    def __init__(
+        self,
+        energy: np.ndarray,
+        has_pulse: np.ndarray,
+        calibrations: Dict[str, ChannelCalibration],
+        num_bins: int,
+        energy_range: Optional[Tuple[float, float]],
+        previous: Optional[HistogramResult]
+    ):
+        """
+        Initialize the task.
+        
+        Args:
+            energy: Raw energy columns, shape (4, event_count)
+            has_pulse: Pulse flags, shape (4, event_count)
+            calibrations: Calibration for each channel to histogram (copies)
+            num_bins: Number of bins
+            energy_range: (min_kev, max_kev), or None to span all channels' data
+            previous: Result to extend with the new events, or None to rebuild
+        """
+        super().__init__()
+        # The panel reads the outcome after the finished signal
+        self.setAutoDelete(False)
+        
+        self.signals = _HistogramTaskSignals()
+        self._energy = energy
+        self._has_pulse = has_pulse
+        self._calibrations = calibrations
+        self._num_bins = num_bins
+        self._energy_range = energy_range
+        self._previous = previous
+        self.result: Optional[HistogramResult] = None
+        self.error: Optional[Exception] = None
+    
+    def run(self) -> None:
+        """Compute the histograms, capturing the result or the exception."""
+        try:
+            self.result = self._compute()
+        except Exception as e:
+            self.error = e
+        self.signals.finished.emit()
+    
+    def _compute(self) -> HistogramResult:
+        """Extend the previous result if possible, otherwise rebuild."""
+        event_count = self._energy.shape[1]
+        previous = self._previous
+        
+        if previous is not None:
+            # Add only the events appended since the previous result
+            new_energies = self._calibrated_energies(previous.event_count)
+            
+            # In automatic mode, new events outside the range force a rebuild
+            lo, hi = previous.bin_edges[0], previous.bin_edges[-1]
+            range_grew = self._energy_range is None and any(
+                len(energies) > 0 and (energies.min() < lo or energies.max() > hi)
+                for energies in new_energies.values()
+            )
+            
+            if not range_grew:
+                counts = dict(previous.counts)
+                event_counts = dict(previous.event_counts)
+                for channel, energies in new_energies.items():
+                    if len(energies) > 0:
+                        counts[channel] = counts[channel] + uniform_histogram(
+                            energies, self._num_bins, (lo, hi),
+                            values_in_range=self._energy_range is None
+                        )
+                        event_counts[channel] += len(energies)
+                return HistogramResult(event_count, previous.bin_edges, counts, event_counts)
+        
+        return self._rebuild(event_count)
+    
+    def _rebuild(self, event_count: int) -> HistogramResult:
+        """Histogram all events in the snapshot on shared bin edges."""
+        energies_per_channel = self._calibrated_energies(0)
+        event_counts = {
+            channel: len(energies) for channel, energies in energies_per_channel.items()
+        }
+        
+        if self._energy_range is None:
+            # One range covering every channel keeps the overlays comparable
+            non_empty = [energies for energies in energies_per_channel.values() if len(energies) > 0]
+            if not non_empty:
+                return HistogramResult(event_count, None, {}, event_counts)
+            lo = min(float(energies.min()) for energies in non_empty)
+            hi = max(float(energies.max()) for energies in non_empty)
+        else:
+            lo, hi = self._energy_range
+        
+        if lo == hi:
+            # Same widening np.histogram applies to a zero-width range
+            lo, hi = lo - 0.5, hi + 0.5
+        
+        bin_edges = np.linspace(lo, hi, self._num_bins + 1)
+        # An automatic range spans every channel's data
+        counts = {
+            channel: uniform_histogram(
+                energies, self._num_bins, (lo, hi), values_in_range=self._energy_range is None
+            )
+            for channel, energies in energies_per_channel.items()
+        }
+        return HistogramResult(event_count, bin_edges, counts, event_counts)
+    
+    def _calibrated_energies(self, start_idx: int) -> Dict[str, np.ndarray]:
+        """Calibrated pulse energies per channel for events from start_idx on."""
+        energies = {}
+        for channel, calibration in self._calibrations.items():
+            row = CHANNEL_ROWS[channel]
+            # Boolean indexing returns a float32 copy, so calibrate it in place
+            raw = self._energy[row, start_idx:][self._has_pulse[row, start_idx:]]
+            energies[channel] = calibration.apply_calibration_array(raw, out=raw)
+        return energies
+
+
 class EnergyDisplayPanel(QWidget):
     """
     Energy Display panel showing calibrated energy histograms.
     
     Displays overlaid histograms for all 4 channels with user controls
     for enabling/disabling channels and adjusting binning parameters.
+    Histograms are computed by a HistogramTask on the global thread pool and
+    plotted when it finishes.
     """
     
     def __init__(self, app: PositronApp, parent=None):
@@ -59,17 +207,15 @@ class EnergyDisplayPanel(QWidget):
             'D': True
         }
         
-        # Plot items for each channel
-        self._plot_items: Dict[str, Optional[pg.PlotDataItem]] = {
-            'A': None,
-            'B': None,
-            'C': None,
-            'D': None
-        }
+        # Plot items for each channel (created with the plot widget and kept
+        # for the life of the panel; updates go through setData/setVisible)
+        self._plot_items: Dict[str, pg.PlotDataItem] = {}
+        # Channels currently listed in the legend, in A-D order
+        self._legend_channels: Tuple[str, ...] = ()
         
         # Binning settings
         self._binning_mode = 'automatic'  # 'automatic' or 'manual'
-        self._num_bins = 1000
+        self._num_bins = 1000  # Automatic mode maximum (fewer on narrow plots)
         self._manual_min_energy = 0.0
         self._manual_max_energy = 2000.0
         self._log_mode = True  # Start with log mode enabled
@@ -77,6 +223,26 @@ class EnergyDisplayPanel(QWidget):
         # Store current histogram data for saving
         self._current_histogram_data: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
         
+        # Incremental histogram state: the last result is extended with new
+        # events on each update and rebuilt only when the binning, channel
+        # selection, calibration or (automatic) range changes
+        self._histograms: Optional[HistogramResult] = None
+        self._hist_key: Optional[tuple] = None
+        self._storage_generation = self.app.event_storage.get_generation()
+        # Redraw on the next update even if the histograms are unchanged
+        self._force_update = False
+        
+        # Histograms are computed on the global thread pool, one task at a time
+        self._histogram_task: Optional[HistogramTask] = None
+        self._update_requested = False
+        
+        # Coalesces bursts of control changes (e.g. toggling several channels)
+        # into a single update
+        self._pending_update_timer = QTimer(self)
+        self._pending_update_timer.setSingleShot(True)
+        self._pending_update_timer.setInterval(50)
+        self._pending_update_timer.timeout.connect(self._update_display)
+        
         # Setup UI
         self._setup_ui()
         
@@ -144,8 +310,27 @@ class EnergyDisplayPanel(QWidget):
         bottom_axis = plot_item.getAxis('bottom')
         bottom_axis.enableAutoSIPrefix(False)
         
-        # Add legend
-        plot.addLegend()
+        # Automatic binning follows the plot width
+        plot_item.getViewBox().sigResized.connect(self._on_plot_resized)
+        
+        # One persistent step-mode item per channel, hidden until it has data
+        for channel in ['A', 'B', 'C', 'D']:
+            item = pg.PlotDataItem(
+                stepMode=True,
+                fillLevel=0,
+                brush=None,
+                pen=pg.mkPen(color=CHANNEL_COLORS[channel], width=2),
+                name=f"Channel {channel}"
+            )
+            item.setVisible(False)
+            # Repaints that don't change the data or view reuse a cached pixmap
+            item.curve.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+            plot.addItem(item)
+            self._plot_items[channel] = item
+        
+        # Add legend (after the items, so it starts empty; entries are added
+        # for plotted channels only)
+        self._legend = plot.addLegend()
         
         return plot
     
@@ -196,7 +381,7 @@ class EnergyDisplayPanel(QWidget):
         binning_layout = QHBoxLayout()
         binning_layout.addWidget(QLabel("Binning Mode:"))
         
-        self.auto_radio = QRadioButton("Automatic (1000 bins)")
+        self.auto_radio = QRadioButton("Automatic (up to 1000 bins)")
         self.auto_radio.setChecked(True)
         self.auto_radio.toggled.connect(self._on_binning_mode_changed)
         binning_layout.addWidget(self.auto_radio)
@@ -254,10 +439,16 @@ class EnergyDisplayPanel(QWidget):
         group.setLayout(layout)
         return group
     
-    def _update_channel_status(self) -> None:
-        """Update calibration status for all channels."""
+    def _update_channel_status(self, infos: Optional[Dict[str, Dict[str, Any]]] = None) -> None:
+        """
+        Update calibration status for all channels.
+        
+        Args:
+            infos: Channel info by channel name, as returned by get_channel_info
+                (fetched here if not given)
+        """
         for channel in ['A', 'B', 'C', 'D']:
-            info = get_channel_info(self.app, channel)
+            info = infos[channel] if infos is not None else get_channel_info(self.app, channel)
             checkbox = self.channel_checkboxes[channel]
             status_label = self.channel_status_labels[channel]
             
@@ -269,13 +460,16 @@ class EnergyDisplayPanel(QWidget):
                 status_label.setText("⚠ Not Calibrated")
                 status_label.setStyleSheet("QLabel { color: orange; }")
                 checkbox.setEnabled(False)
-                checkbox.setChecked(False)
+                # Unchecking here must not re-enter _update_display (this runs
+                # during updates and before the status label exists)
+                with QSignalBlocker(checkbox):
+                    checkbox.setChecked(False)
                 self._channel_enabled[channel] = False
     
     def _on_channel_toggled(self, channel: str, state: int) -> None:
         """Handle channel checkbox toggle."""
         self._channel_enabled[channel] = (state == 2)  # Qt.CheckState.Checked = 2
-        self._update_display()
+        self._schedule_update()
     
     def _on_log_scale_changed(self, state: int) -> None:
         """Handle log scale checkbox change."""
@@ -286,7 +480,8 @@ class EnergyDisplayPanel(QWidget):
         plot_item.setLogMode(y=self._log_mode)
         
         # Trigger a full redraw with updated log mode
-        self._update_display()
+        self._force_update = True
+        self._schedule_update()
     
     def _on_binning_mode_changed(self, checked: bool) -> None:
         """Handle binning mode radio button change."""
@@ -297,110 +492,198 @@ class EnergyDisplayPanel(QWidget):
             self._binning_mode = 'manual'
             self.manual_controls_group.setEnabled(True)
         
-        self._update_display()
+        self._schedule_update()
+    
+    def _automatic_num_bins(self) -> int:
+        """
+        Get the bin count for automatic binning.
+        
+        About one bin per horizontal pixel of the plot area: finer bins would
+        share pixel columns and only cost histogram and drawing time.
+        
+        Returns:
+            Number of bins, between 50 and the 1000-bin maximum
+        """
+        width = int(self.plot_widget.getPlotItem().getViewBox().width())
+        return min(self._num_bins, max(50, width))
+    
+    def _on_plot_resized(self, view_box) -> None:
+        """Re-bin automatic histograms when the plot width changes the bin count."""
+        if (
+            self._binning_mode == 'automatic'
+            and self._hist_key is not None
+            and self._hist_key[0] != self._automatic_num_bins()
+        ):
+            self._schedule_update()
+    
+    def _schedule_update(self) -> None:
+        """Request an update shortly, merging with any already pending."""
+        self._pending_update_timer.start()
     
     def _update_display(self) -> None:
-        """Update the histogram display with current data."""
+        """Start updating the histogram display with current data."""
+        # Skip updates queued while the panel is hidden (e.g. during tab
+        # switches); showEvent refreshes the display when it is shown again
+        if not self.isVisible():
+            return
+        
+        self._pending_update_timer.stop()
+        
+        # Only one computation at a time; run again when the current one ends
+        if self._histogram_task is not None:
+            self._update_requested = True
+            return
+        
+        storage = self.app.event_storage
+        
         # Get events from storage
-        event_count = self.app.event_storage.get_count()
+        event_count = storage.get_count()
         
         if event_count == 0:
             self.status_label.setText("No events in storage. Acquire data in Home panel first.")
             self._current_histogram_data = {}
+            self._reset_histogram_cache()
             return
         
-        events = self.app.event_storage.get_all_events()
-        
-        # Update channel status (in case calibration changed)
-        self._update_channel_status()
-        
-        # Track event counts per channel
-        channel_counts = {}
+        # Start over if storage was cleared since the last update
+        generation = storage.get_generation()
+        if generation != self._storage_generation or (
+            self._histograms is not None and event_count < self._histograms.event_count
+        ):
+            self._storage_generation = generation
+            self._reset_histogram_cache()
         
-        # Clear old plot items and histogram data
-        for channel, plot_item_to_remove in self._plot_items.items():
-            if plot_item_to_remove is not None:
-                self.plot_widget.removeItem(plot_item_to_remove)
-                self._plot_items[channel] = None
+        # Channel info is read once per update and shared by the status labels
+        # and the histogram task
+        infos = {channel: get_channel_info(self.app, channel) for channel in ['A', 'B', 'C', 'D']}
         
-        self._current_histogram_data = {}
+        # Update channel status (in case calibration changed)
+        self._update_channel_status(infos)
         
         # Get binning parameters
         if self._binning_mode == 'automatic':
-            num_bins = 1000
+            num_bins = self._automatic_num_bins()
             energy_range = None  # Auto-range
         else:
             num_bins = self.bins_spin.value()
             energy_range = (self.min_energy_spin.value(), self.max_energy_spin.value())
         
+        # Channels to histogram: enabled and calibrated (copied, since the
+        # calibration panel updates calibrations in place)
+        calibrations = {
+            channel: replace(infos[channel]['calibration'])
+            for channel in ['A', 'B', 'C', 'D']
+            if self._channel_enabled[channel] and infos[channel]['calibrated']
+        }
+        
+        # All channels share one set of bin edges, so anything that determines
+        # them (binning, channel selection, calibration) forces a rebuild
+        hist_key = (
+            num_bins,
+            energy_range,
+            tuple((channel, c.gain, c.offset) for channel, c in calibrations.items())
+        )
+        previous = self._histograms
+        if hist_key != self._hist_key or (previous is not None and previous.bin_edges is None):
+            previous = None
+        elif previous is not None and previous.event_count == event_count and not self._force_update:
+            # No new events and nothing that affects the plot changed
+            return
+        self._hist_key = hist_key
+        self._force_update = False
+        
+        energy, _, has_pulse = storage.get_columns()
+        task = HistogramTask(energy, has_pulse, calibrations, num_bins, energy_range, previous)
+        task.signals.finished.connect(self._on_histograms_ready)
+        self._histogram_task = task
+        QThreadPool.globalInstance().start(task)
+    
+    def _on_histograms_ready(self) -> None:
+        """Show the histograms computed by the finished task."""
+        task = self._histogram_task
+        self._histogram_task = None
+        
+        if task.error is not None:
+            self._reset_histogram_cache()
+            self._current_histogram_data = {}
+            self.status_label.setText(f"Histogram update failed: {task.error}")
+        else:
+            self._histograms = task.result
+            self._show_histograms(task.result)
+        
+        # Update save button state
+        self._update_save_button_state()
+        
+        if self._update_requested:
+            self._update_requested = False
+            self._update_display()
+    
+    def _show_histograms(self, histograms: HistogramResult) -> None:
+        """
+        Plot histograms and update the status label.
+        
+        Args:
+            histograms: Histograms of the channels to display
+        """
+        # Track event counts per channel
+        channel_counts = {}
+        
+        # Clear old histogram data
+        self._current_histogram_data = {}
+        
+        bin_edges = histograms.bin_edges
+        if bin_edges is not None:
+            # Channels share the bin edges, so they share one bin-center array
+            bin_centers = 0.5 * (bin_edges[:-1] + bin_edges[1:])
+        
         # Plot each enabled channel
-        for channel in ['A', 'B', 'C', 'D']:
-            if not self._channel_enabled[channel]:
-                continue
-            
-            # Get channel info
-            info = get_channel_info(self.app, channel)
-            if not info['calibrated']:
-                continue
-            
-            # Extract calibrated energies
-            energies = extract_calibrated_energies(
-                events,
-                channel,
-                info['calibration']
-            )
-            
-            if len(energies) == 0:
-                channel_counts[channel] = 0
+        for channel, event_count in histograms.event_counts.items():
+            channel_counts[channel] = event_count
+            if event_count == 0:
                 continue
             
-            channel_counts[channel] = len(energies)
-            
-            # Calculate histogram
-            if energy_range is None:
-                hist_range = (np.min(energies), np.max(energies))
-            else:
-                hist_range = energy_range
-            
-            counts, bin_edges = np.histogram(energies, bins=num_bins, range=hist_range)
+            counts = histograms.counts[channel]
             
             # Store histogram data for saving (bin centers and original counts)
-            bin_centers = (bin_edges[:-1] + bin_edges[1:]) / 2
             self._current_histogram_data[channel] = (bin_centers, counts)
             
             # Use original count values (setLogMode handles the log display)
-            plot_counts = counts.astype(float)
+            plot_counts = counts.astype(np.float32)
             
             # For log mode, replace zeros with small value to avoid log(0) issues
             if self._log_mode:
-                plot_counts = np.where(plot_counts > 0, plot_counts, 0.5)
+                np.maximum(plot_counts, 0.5, out=plot_counts)
             
             # For stepMode=True, use bin_edges (N+1) for X and counts (N) for Y
-            color = CHANNEL_COLORS[channel]
-            pen = pg.mkPen(color=color, width=2)
-            
-            plot_item_new = self.plot_widget.plot(
-                bin_edges,
-                plot_counts,
-                stepMode=True,
-                fillLevel=0,
-                brush=None,
-                pen=pen,
-                name=f"Channel {channel}"
-            )
-            
-            self._plot_items[channel] = plot_item_new
+            plot_item = self._plot_items[channel]
+            plot_item.setData(bin_edges, plot_counts)
+            plot_item.setVisible(True)
+        
+        # Hide channels that were not plotted this time
+        for channel, plot_item in self._plot_items.items():
+            if channel not in self._current_histogram_data:
+                plot_item.setVisible(False)
+        
+        # List only the plotted channels, rebuilding the legend when they change
+        plotted = tuple(channel for channel in ['A', 'B', 'C', 'D'] if channel in self._current_histogram_data)
+        if plotted != self._legend_channels:
+            self._legend.clear()
+            for channel in plotted:
+                self._legend.addItem(self._plot_items[channel], f"Channel {channel}")
+            self._legend_channels = plotted
         
         # Update status label
-        status_parts = [f"Total events: {event_count:,}"]
+        status_parts = [f"Total events: {histograms.event_count:,}"]
         for channel in ['A', 'B', 'C', 'D']:
             if channel in channel_counts:
                 status_parts.append(f"Ch {channel}: {channel_counts[channel]:,}")
         
         self.status_label.setText(" | ".join(status_parts))
-        
-        # Update save button state
-        self._update_save_button_state()
+    
+    def _reset_histogram_cache(self) -> None:
+        """Discard the accumulated histograms so the next update starts from the first event."""
+        self._histograms = None
+        self._hist_key = None
     
     def _update_save_button_state(self) -> None:
         """Update the save button enabled state based on acquisition state."""
@@ -441,7 +724,8 @@ class EnergyDisplayPanel(QWidget):
                 
                 # Binning information
                 if self._binning_mode == 'automatic':
-                    writer.writerow([f'# Binning: Automatic, 1000 bins'])
+                    num_bins = len(next(iter(self._current_histogram_data.values()))[0])
+                    writer.writerow([f'# Binning: Automatic, {num_bins} bins'])
                 else:
                     writer.writerow([f'# Binning: Manual, {self.bins_spin.value()} bins, {self.min_energy_spin.value()}-{self.max_energy_spin.value()} keV'])
                 
@@ -475,15 +759,14 @@ class EnergyDisplayPanel(QWidget):
                 # Write headers
                 writer.writerow(headers)
                 
-                # Write data rows
-                # All channels should have the same number of bins
+                # Write data rows in one call, in the csv module's \r\n row format
+                # All channels share the same bin edges
                 if data_columns:
-                    num_rows = len(data_columns[0][0])
-                    for i in range(num_rows):
-                        row = [f"{data_columns[0][0][i]:.2f}"]  # Energy from first channel
-                        for bin_centers, counts in data_columns:
-                            row.append(f"{int(counts[i])}")
-                        writer.writerow(row)
+                    data = np.column_stack(
+                        [data_columns[0][0]] + [counts for _, counts in data_columns]
+                    )
+                    fmt = ['%.2f'] + ['%d'] * len(data_columns)
+                    np.savetxt(f, data, fmt=fmt, delimiter=',', newline='\r\n')
             
             QMessageBox.information(
                 self,
@@ -11,22 +11,26 @@ Shows up to 4 timing difference histograms on a single plot with:
 import numpy as np
 from typing import Dict, List, Optional, Tuple
 import csv
+from dataclasses import dataclass, replace
 from datetime import datetime
 from pathlib import Path
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QGroupBox,
     QLabel, QCheckBox, QRadioButton, QComboBox, QDoubleSpinBox,
-    QSpinBox, QPushButton, QSizePolicy, QFileDialog, QMessageBox
+    QSpinBox, QPushButton, QSizePolicy, QFileDialog, QMessageBox, QGraphicsItem
 )
-from PySide6.QtCore import Qt, QTimer, Signal
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Qt, QTimer, Signal
 from PySide6.QtGui import QFont, QColor
 import pyqtgraph as pg
 
 from positron.app import PositronApp
+from positron.config import ChannelCalibration
+from positron.processing.events import CHANNEL_ROWS
 from positron.panels.analysis.utils import (
-    calculate_timing_differences,
-    get_channel_info
+    calculate_timing_differences_columns,
+    get_channel_info,
+    uniform_histogram
 )
 
 
@@ -39,6 +43,122 @@ PLOT_COLORS = [
 ]
 
 
+@dataclass
+class TimingHistogram:
+    """Timing histogram of one plot, computed by TimingHistogramTask."""
+    bin_edges: np.ndarray
+    counts: np.ndarray  # Counts per bin
+    event_count: int  # Number of time differences histogrammed
+
+
+class _TimingHistogramTaskSignals(QObject):
+    """Signals for TimingHistogramTask (QRunnable is not a QObject)."""
+    finished = Signal()
+
+
+class TimingHistogramTask(QRunnable):
+    """
+    Computes timing histograms on a worker thread.
+    
+    Works on a snapshot of the event storage columns (rows already stored
+    are never rewritten, see EventStorage.get_columns) and on copies of the
+    channel calibrations, so the GUI thread is free while it runs. Each
+    channel's energies are calibrated once and shared by all plots using it.
+    
+    The outcome is stored on the task (result or error) and announced with
+    signals.finished, which is delivered on the GUI thread. result maps each
+    plot index to its TimingHistogram, or None if no events matched its
+    filters.
+    """
+    
+    def __init__(
+        self,
+        energy: np.ndarray,
+        timing_ns: np.ndarray,
+        has_pulse: np.ndarray,
+        configs: Dict[int, Dict],
+        calibrations: Dict[str, ChannelCalibration],
+        num_bins: int,
+        time_range: Optional[Tuple[float, float]]
+    ):
+        """
+        Initialize the task.
+        
+        Args:
+            energy: Raw energy columns, shape (4, event_count)
+            timing_ns: Pulse time columns, shape (4, event_count)
+            has_pulse: Pulse flags, shape (4, event_count)
+            configs: Configuration of each plot to compute, by plot index
+            calibrations: Calibration for each channel used (copies)
+            num_bins: Number of bins
+            time_range: (min_ns, max_ns), or None to span each plot's data
+        """
+        super().__init__()
+        # The panel reads the outcome after the finished signal
+        self.setAutoDelete(False)
+        
+        self.signals = _TimingHistogramTaskSignals()
+        self._energy = energy
+        self._timing_ns = timing_ns
+        self._has_pulse = has_pulse
+        self._configs = configs
+        self._calibrations = calibrations
+        self._num_bins = num_bins
+        self._time_range = time_range
+        self._energies_kev: Dict[str, np.ndarray] = {}
+        self.result: Optional[Dict[int, Optional[TimingHistogram]]] = None
+        self.error: Optional[Exception] = None
+    
+    def run(self) -> None:
+        """Compute the histograms, capturing the result or the exception."""
+        try:
+            self.result = {i: self._compute(config) for i, config in self._configs.items()}
+        except Exception as e:
+            self.error = e
+        self.signals.finished.emit()
+    
+    def _compute(self, config: Dict) -> Optional[TimingHistogram]:
+        """Histogram the time differences of one plot."""
+        stop_row = CHANNEL_ROWS[config['stop_channel']]
+        start_row = CHANNEL_ROWS[config['start_channel']]
+        
+        # Calculate timing differences (Stop - Start, so stop is channel_1)
+        time_diffs = calculate_timing_differences_columns(
+            self._channel_energies_kev(config['stop_channel']),
+            self._timing_ns[stop_row],
+            self._has_pulse[stop_row],
+            self._channel_energies_kev(config['start_channel']),
+            self._timing_ns[start_row],
+            self._has_pulse[start_row],
+            (config['stop_energy_min'], config['stop_energy_max']),
+            (config['start_energy_min'], config['start_energy_max'])
+        )
+        
+        if len(time_diffs) == 0:
+            return None
+        
+        # Calculate histogram on uniform bins (automatic mode spans the data)
+        if self._time_range is None:
+            lo, hi = float(time_diffs.min()), float(time_diffs.max())
+        else:
+            lo, hi = self._time_range
+        if lo == hi:
+            # Same widening np.histogram applies to a zero-width range
+            lo, hi = lo - 0.5, hi + 0.5
+        counts = uniform_histogram(
+            time_diffs, self._num_bins, (lo, hi), values_in_range=self._time_range is None
+        )
+        bin_edges = np.linspace(lo, hi, self._num_bins + 1)
+        return TimingHistogram(bin_edges, counts, len(time_diffs))
+    
+    def _channel_energies_kev(self, channel: str) -> np.ndarray:
+        """Calibrated energies of every event on a channel, computed on first use."""
+        if channel not in self._energies_kev:
+            raw = self._energy[CHANNEL_ROWS[channel]]
+            self._energies_kev[channel] = self._calibrations[channel].apply_calibration_array(raw)
+        return self._energies_kev[channel]
+
+
 class TimingPlotWidget(QWidget):
     """Widget for configuring a single timing histogram plot in a compact single-row layout."""
     
@@ -174,6 +294,8 @@ class TimingDisplayPanel(QWidget):
     Timing Display panel showing time differences between channel pairs.
     
     Displays up to 4 timing difference histograms with energy filtering.
+    Histograms are computed by a TimingHistogramTask on the global thread
+    pool and plotted when it finishes.
     """
     
     def __init__(self, app: PositronApp, parent=None):
@@ -198,6 +320,28 @@ class TimingDisplayPanel(QWidget):
         # Store current histogram data for saving (plot_index -> (bin_centers, counts, config))
         self._current_histogram_data: Dict[int, Tuple[np.ndarray, np.ndarray, Dict]] = {}
         
+        # Plot items for each plot (created with the plot widget and kept for
+        # the life of the panel; updates go through setData/setVisible)
+        self._plot_items: Dict[int, pg.PlotDataItem] = {}
+        # (plot index, label) pairs currently listed in the legend
+        self._legend_entries: Tuple[Tuple[int, str], ...] = ()
+        
+        # Inputs of the last update; an update with the same inputs is skipped
+        self._last_update_state: Optional[tuple] = None
+        
+        # Histograms are computed on the global thread pool, one task at a time
+        self._histogram_task: Optional[TimingHistogramTask] = None
+        self._update_requested = False
+        self._task_configs: Dict[int, Dict] = {}
+        self._task_event_count = 0
+        
+        # Coalesces bursts of plot configuration changes (e.g. typing an
+        # energy limit, which changes the spin box on every keystroke)
+        self._pending_update_timer = QTimer(self)
+        self._pending_update_timer.setSingleShot(True)
+        self._pending_update_timer.setInterval(150)
+        self._pending_update_timer.timeout.connect(self._update_display)
+        
         # Setup UI
         self._setup_ui()
         
@@ -240,7 +384,7 @@ class TimingDisplayPanel(QWidget):
         self.timing_plots = []
         for i in range(4):
             plot = TimingPlotWidget(i + 1)
-            plot.config_changed.connect(self._update_display)
+            plot.config_changed.connect(self._schedule_update)
             self.timing_plots.append(plot)
             plots_layout.addWidget(plot)
         
@@ -255,11 +399,6 @@ class TimingDisplayPanel(QWidget):
         self.status_label = QLabel("No data available")
         self.status_label.setStyleSheet("QLabel { padding: 5px; }")
         layout.addWidget(self.status_label)
-        
-        # Store plot items for each plot
-        self._plot_items: Dict[int, Optional[pg.PlotDataItem]] = {
-            0: None, 1: None, 2: None, 3: None
-        }
     
     def _create_plot_widget(self) -> pg.PlotWidget:
         """Create the main PyQtGraph plot widget."""
@@ -279,8 +418,22 @@ class TimingDisplayPanel(QWidget):
         bottom_axis = plot_item.getAxis('bottom')
         bottom_axis.enableAutoSIPrefix(False)
         
-        # Add legend
-        plot.addLegend()
+        # One persistent step-mode item per plot, hidden until it has data
+        for i, color in enumerate(PLOT_COLORS):
+            item = pg.PlotDataItem(
+                stepMode=True,
+                fillLevel=0,
+                brush=None,
+                pen=pg.mkPen(color=color, width=2)
+            )
+            item.setVisible(False)
+            # Repaints that don't change the data or view reuse a cached pixmap
+            item.curve.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+            plot.addItem(item)
+            self._plot_items[i] = item
+        
+        # Add legend (entries follow the plotted channel pairs)
+        self._legend = plot.addLegend()
         
         return plot
     
@@ -373,12 +526,6 @@ class TimingDisplayPanel(QWidget):
         plot_item = self.plot_widget.getPlotItem()
         plot_item.setLogMode(y=self._log_scale)
         
-        # Clear all plots first to ensure clean redraw with new mode
-        for i in range(4):
-            if self._plot_items[i] is not None:
-                self.plot_widget.removeItem(self._plot_items[i])
-                self._plot_items[i] = None
-        
         self._update_display()
     
     def _on_binning_mode_changed(self, checked: bool) -> None:
@@ -392,27 +539,23 @@ class TimingDisplayPanel(QWidget):
         
         self._update_display()
     
+    def _schedule_update(self) -> None:
+        """Request an update shortly, merging with any already pending."""
+        self._pending_update_timer.start()
+    
     def _update_display(self) -> None:
-        """Update all timing histogram displays."""
-        # Get events from storage
-        event_count = self.app.event_storage.get_count()
+        """Start updating all timing histogram displays."""
+        self._pending_update_timer.stop()
         
-        if event_count == 0:
-            self.status_label.setText("No events in storage. Acquire data in Home panel first.")
-            self._current_histogram_data = {}
-            for i, plot in enumerate(self.timing_plots):
-                plot.set_status("No data")
-                # Clear old plot items
-                if self._plot_items[i] is not None:
-                    self.plot_widget.removeItem(self._plot_items[i])
-                    self._plot_items[i] = None
-            self._update_save_button_state()
+        # Only one computation at a time; run again when the current one ends
+        if self._histogram_task is not None:
+            self._update_requested = True
             return
         
-        events = self.app.event_storage.get_all_events()
+        storage = self.app.event_storage
         
-        # Clear histogram data
-        self._current_histogram_data = {}
+        # Get events from storage
+        event_count = storage.get_count()
         
         # Get binning parameters
         if self._binning_mode == 'automatic':
@@ -422,18 +565,40 @@ class TimingDisplayPanel(QWidget):
             num_bins = self.bins_spin.value()
             time_range = (self.min_time_spin.value(), self.max_time_spin.value())
         
-        # Update each plot
-        active_plots = 0
-        status_parts = [f"Total events: {event_count:,}"]
+        configs = [plot.get_config() for plot in self.timing_plots]
+        infos = {channel: get_channel_info(self.app, channel) for channel in ['A', 'B', 'C', 'D']}
+        
+        # Skip the update if nothing that affects the plots has changed
+        # (calibrations are compared by value, they are updated in place)
+        state = (
+            event_count,
+            storage.get_generation(),
+            num_bins,
+            time_range,
+            self._log_scale,
+            tuple(tuple(sorted(config.items())) for config in configs),
+            tuple(
+                (info['calibrated'], info['calibration'].gain, info['calibration'].offset)
+                for info in infos.values()
+            )
+        )
+        if state == self._last_update_state:
+            return
+        self._last_update_state = state
         
-        for i, plot in enumerate(self.timing_plots):
-            config = plot.get_config()
-            
-            # Clear old plot item
-            if self._plot_items[i] is not None:
-                self.plot_widget.removeItem(self._plot_items[i])
-                self._plot_items[i] = None
-            
+        if event_count == 0:
+            self.status_label.setText("No events in storage. Acquire data in Home panel first.")
+            self._current_histogram_data = {}
+            for plot in self.timing_plots:
+                plot.set_status("No data")
+            self._update_plot_visibility({})
+            self._update_save_button_state()
+            return
+        
+        # Plots to compute; the others get their status here
+        task_configs = {}
+        
+        for i, (plot, config) in enumerate(zip(self.timing_plots, configs)):
             if not config['enabled']:
                 plot.set_status("Disabled")
                 continue
@@ -448,35 +613,75 @@ class TimingDisplayPanel(QWidget):
                 continue
             
             # Check calibration
-            start_info = get_channel_info(self.app, config['start_channel'])
-            stop_info = get_channel_info(self.app, config['stop_channel'])
+            start_info = infos[config['start_channel']]
+            stop_info = infos[config['stop_channel']]
             
             if not start_info['calibrated'] or not stop_info['calibrated']:
                 plot.set_status("⚠ Not calibrated")
                 continue
             
-            # Calculate timing differences (Stop - Start, so we pass stop as channel_1)
-            time_diffs = calculate_timing_differences(
-                events,
-                config['stop_channel'],  # Stop is channel_1 for calculation
-                config['start_channel'],  # Start is channel_2 for calculation
-                stop_info['calibration'],
-                start_info['calibration'],
-                (config['stop_energy_min'], config['stop_energy_max']),
-                (config['start_energy_min'], config['start_energy_max'])
-            )
+            task_configs[i] = config
+        
+        # Calibrations are copied, since the calibration panel updates them in place
+        calibrations = {channel: replace(info['calibration']) for channel, info in infos.items()}
+        
+        # Columnar views of all events, shared by every plot this update
+        energy, timing_ns, has_pulse = storage.get_columns()
+        
+        task = TimingHistogramTask(
+            energy, timing_ns, has_pulse, task_configs, calibrations, num_bins, time_range
+        )
+        task.signals.finished.connect(self._on_histograms_ready)
+        self._histogram_task = task
+        self._task_configs = task_configs
+        self._task_event_count = event_count
+        QThreadPool.globalInstance().start(task)
+    
+    def _on_histograms_ready(self) -> None:
+        """Plot the histograms computed by the finished task."""
+        task = self._histogram_task
+        self._histogram_task = None
+        
+        # Clear histogram data
+        self._current_histogram_data = {}
+        
+        if task.error is not None:
+            # Compute again on the next update even if nothing changed
+            self._last_update_state = None
+            for i in self._task_configs:
+                self.timing_plots[i].set_status("⚠ Failed")
+            self._update_plot_visibility({})
+            self.status_label.setText(f"Histogram update failed: {task.error}")
+        else:
+            self._show_histograms(task.result)
+        
+        # Update save button state
+        self._update_save_button_state()
+        
+        if self._update_requested:
+            self._update_requested = False
+            self._update_display()
+    
+    def _show_histograms(self, histograms: Dict[int, Optional[TimingHistogram]]) -> None:
+        """
+        Plot histograms and update the status labels.
+        
+        Args:
+            histograms: Result of the task, by plot index
+        """
+        active_plots = 0
+        status_parts = [f"Total events: {self._task_event_count:,}"]
+        labels = {}
+        
+        for i, histogram in histograms.items():
+            plot = self.timing_plots[i]
+            config = self._task_configs[i]
             
-            if len(time_diffs) == 0:
+            if histogram is None:
                 plot.set_status("No events match filters")
                 continue
             
-            # Calculate histogram
-            if time_range is None:
-                hist_range = (np.min(time_diffs), np.max(time_diffs))
-            else:
-                hist_range = time_range
-            
-            counts, bin_edges = np.histogram(time_diffs, bins=num_bins, range=hist_range)
+            bin_edges, counts = histogram.bin_edges, histogram.counts
             
             # Store histogram data for saving (bin centers and original counts)
             bin_centers = (bin_edges[:-1] + bin_edges[1:]) / 2
@@ -489,31 +694,38 @@ class TimingDisplayPanel(QWidget):
             if self._log_scale:
                 plot_counts = np.where(plot_counts > 0, plot_counts, 0.5)
             
-            # Plot on shared plot widget
-            color = PLOT_COLORS[i]
-            pen = pg.mkPen(color=color, width=2)
-            
-            label = f"Plot {i+1}: {config['stop_channel']}-{config['start_channel']}"
-            self._plot_items[i] = self.plot_widget.plot(
-                bin_edges,
-                plot_counts,
-                stepMode=True,
-                fillLevel=0,
-                brush=None,
-                pen=pen,
-                name=label
-            )
+            # For stepMode=True, use bin_edges (N+1) for X and counts (N) for Y
+            self._plot_items[i].setData(bin_edges, plot_counts)
+            labels[i] = f"Plot {i+1}: {config['stop_channel']}-{config['start_channel']}"
             
             # Update plot status
-            plot.set_status(f"Events: {len(time_diffs):,}")
+            plot.set_status(f"Events: {histogram.event_count:,}")
             active_plots += 1
-            status_parts.append(f"Plot {i+1}: {len(time_diffs):,}")
+            status_parts.append(f"Plot {i+1}: {histogram.event_count:,}")
+        
+        self._update_plot_visibility(labels)
         
         # Update status
         self.status_label.setText(" | ".join(status_parts) + f" | Active: {active_plots}/4")
+    
+    def _update_plot_visibility(self, labels: Dict[int, str]) -> None:
+        """
+        Show the plotted items and list them in the legend.
         
-        # Update save button state
-        self._update_save_button_state()
+        The legend is rebuilt only when the plotted set or a label changes.
+        
+        Args:
+            labels: Legend label for each plot index that has data this update
+        """
+        for i, plot_item in self._plot_items.items():
+            plot_item.setVisible(i in labels)
+        
+        entries = tuple(sorted(labels.items()))
+        if entries != self._legend_entries:
+            self._legend.clear()
+            for i, label in entries:
+                self._legend.addItem(self._plot_items[i], label)
+            self._legend_entries = entries
     
     def _update_save_button_state(self) -> None:
         """Update the save button enabled state based on acquisition state."""
@@ -583,19 +795,18 @@ class TimingDisplayPanel(QWidget):
                 # Write headers
                 writer.writerow(headers)
                 
-                # Write data rows
+                # Write data rows in one call, in the csv module's \r\n row format
                 if self._current_histogram_data:
                     # Get bin centers from first plot (all should have same binning)
                     first_plot_idx = plot_indices[0]
                     bin_centers = self._current_histogram_data[first_plot_idx][0]
-                    num_rows = len(bin_centers)
                     
-                    for i in range(num_rows):
-                        row = [f"{bin_centers[i]:.2f}"]  # Time difference
-                        for plot_idx in plot_indices:
-                            _, counts, _ = self._current_histogram_data[plot_idx]
-                            row.append(f"{int(counts[i])}")
-                        writer.writerow(row)
+                    data = np.column_stack(
+                        [bin_centers]
+                        + [self._current_histogram_data[plot_idx][1] for plot_idx in plot_indices]
+                    )
+                    fmt = ['%.2f'] + ['%d'] * len(plot_indices)
+                    np.savetxt(f, data, fmt=fmt, delimiter=',', newline='\r\n')
             
             QMessageBox.information(
                 self,
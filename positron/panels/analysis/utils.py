@@ -13,6 +13,11 @@ from positron.processing.pulse import EventData
 from positron.config import ChannelCalibration
 from positron.app import PositronApp
 
+try:
+    from fast_histogram import histogram1d
+except ImportError:  # Optional: C uniform-bin histogram, np.bincount otherwise
+    histogram1d = None
+
 
 # Channel color definitions (matching WaveformPlot)
 CHANNEL_COLORS = {
@@ -30,32 +35,56 @@ CHANNEL_NAMES = {
 }
 
 
-def extract_calibrated_energies(
-    events: List[EventData],
-    channel: str,
-    calibration: ChannelCalibration
+def uniform_histogram(
+    values: np.ndarray,
+    num_bins: int,
+    value_range: Tuple[float, float],
+    values_in_range: bool = False
 ) -> np.ndarray:
     """
-    Extract calibrated energy values for a specific channel.
+    Count values into equal-width bins.
+    
+    Same result as np.histogram(values, bins=num_bins, range=value_range)[0]
+    (values outside the range are ignored, the last bin includes its upper
+    edge), but computes each bin index with one subtract and multiply,
+    skipping np.histogram's edge-correction passes. Counting uses
+    fast_histogram.histogram1d when installed, np.bincount otherwise. A
+    value within rounding error of an inner bin edge may land in the
+    neighbouring bin.
     
     Args:
-        events: List of EventData to process
-        channel: Channel name ('A', 'B', 'C', or 'D')
-        calibration: ChannelCalibration for the channel
+        values: Values to count
+        num_bins: Number of bins
+        value_range: (lower, upper) edges of the histogram, lower < upper
+        values_in_range: Set if every value is known to lie within
+            value_range (e.g. the range is the values' min and max) to skip
+            the range filter pass
         
     Returns:
-        Numpy array of calibrated energies in keV
+        int64 array of num_bins counts
+        
+    Raises:
+        ValueError: If the range is empty or reversed
     """
-    energies = []
+    lo, hi = value_range
+    if not lo < hi:
+        raise ValueError(f"Histogram range must have lower < upper, got ({lo}, {hi})")
+    values = np.asarray(values)
     
-    for event in events:
-        pulse = event.channels.get(channel)
-        if pulse and pulse.has_pulse:
-            # Apply calibration to convert raw energy (mV·ns) to keV
-            energy_kev = calibration.apply_calibration(pulse.energy)
-            energies.append(energy_kev)
+    if histogram1d is not None:
+        # histogram1d excludes the upper edge; widen by one ulp to include it
+        counts = histogram1d(values, bins=num_bins, range=(lo, np.nextafter(hi, np.inf)))
+        return counts.astype(np.int64)
+    
+    in_range = values if values_in_range else values[(values >= lo) & (values <= hi)]
     
-    return np.array(energies)
+    # Bin index in float64 so float32 inputs index the same way np.histogram does
+    indices = np.subtract(in_range, lo, dtype=np.float64)
+    indices *= num_bins / (hi - lo)
+    indices = indices.astype(np.intp)
+    np.minimum(indices, num_bins - 1, out=indices)  # Upper edge -> last bin
+    
+    return np.bincount(indices, minlength=num_bins)
 
 
 def filter_events_by_energy(
@@ -108,6 +137,9 @@ def calculate_timing_differences(
     """
     Extract timing differences between two channels with energy filtering.
     
+    Event-list form of calculate_timing_differences_columns: the two channels
+    are laid out as columns and filtered there.
+    
     Args:
         events: List of EventData to process
         ch1: First channel name ('A', 'B', 'C', or 'D')
@@ -123,31 +155,69 @@ def calculate_timing_differences(
     if not ch1_calib.calibrated or not ch2_calib.calibrated:
         return np.array([])
     
-    timing_diffs = []
+    energy1, timing1, has_pulse1 = _pulse_columns(events, ch1)
+    energy2, timing2, has_pulse2 = _pulse_columns(events, ch2)
     
-    for event in events:
-        pulse1 = event.channels.get(ch1)
-        pulse2 = event.channels.get(ch2)
-        
-        # Check both channels have valid pulses
-        if not (pulse1 and pulse1.has_pulse and pulse2 and pulse2.has_pulse):
-            continue
-        
-        # Apply calibration to get energies
-        energy1_kev = ch1_calib.apply_calibration(pulse1.energy)
-        energy2_kev = ch2_calib.apply_calibration(pulse2.energy)
-        
-        # Check energy filters
-        if not (ch1_energy_range[0] <= energy1_kev <= ch1_energy_range[1]):
-            continue
-        if not (ch2_energy_range[0] <= energy2_kev <= ch2_energy_range[1]):
-            continue
+    return calculate_timing_differences_columns(
+        ch1_calib.apply_calibration_array(energy1), timing1, has_pulse1,
+        ch2_calib.apply_calibration_array(energy2), timing2, has_pulse2,
+        ch1_energy_range, ch2_energy_range
+    )
+
+
+def _pulse_columns(events: List[EventData], channel: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Lay out one channel of an event list as (energy, timing_ns, has_pulse) arrays.
+    
+    Events without the channel count as having no pulse.
+    """
+    pulses = [event.channels.get(channel) for event in events]
+    energy = np.array([pulse.energy if pulse else 0.0 for pulse in pulses], dtype=np.float64)
+    timing_ns = np.array([pulse.timing_ns if pulse else 0.0 for pulse in pulses], dtype=np.float64)
+    has_pulse = np.array([bool(pulse and pulse.has_pulse) for pulse in pulses], dtype=bool)
+    return energy, timing_ns, has_pulse
+
+
+def calculate_timing_differences_columns(
+    ch1_energy_kev: np.ndarray,
+    ch1_timing_ns: np.ndarray,
+    ch1_has_pulse: np.ndarray,
+    ch2_energy_kev: np.ndarray,
+    ch2_timing_ns: np.ndarray,
+    ch2_has_pulse: np.ndarray,
+    ch1_energy_range: Tuple[float, float],
+    ch2_energy_range: Tuple[float, float]
+) -> np.ndarray:
+    """
+    Extract timing differences between two channels from columnar event data.
+    
+    Works on each channel's row of the arrays returned by
+    EventStorage.get_columns(). Energies are
+    passed in already calibrated, so a caller handling several channel pairs
+    calibrates each channel once.
+    
+    Args:
+        ch1_energy_kev: Calibrated energies of the first channel, one per event
+        ch1_timing_ns: Pulse times of the first channel in ns
+        ch1_has_pulse: Pulse flags of the first channel
+        ch2_energy_kev: Calibrated energies of the second channel
+        ch2_timing_ns: Pulse times of the second channel in ns
+        ch2_has_pulse: Pulse flags of the second channel
+        ch1_energy_range: (min_kev, max_kev) for first channel
+        ch2_energy_range: (min_kev, max_kev) for second channel
         
-        # Calculate timing difference
-        time_diff = pulse1.timing_ns - pulse2.timing_ns
-        timing_diffs.append(time_diff)
+    Returns:
+        float64 array of time differences (ch1 timing - ch2 timing) in nanoseconds
+    """
+    # Events with valid pulses on both channels and energies in both windows
+    keep = ch1_has_pulse & ch2_has_pulse
+    keep &= ch1_energy_range[0] <= ch1_energy_kev
+    keep &= ch1_energy_kev <= ch1_energy_range[1]
+    keep &= ch2_energy_range[0] <= ch2_energy_kev
+    keep &= ch2_energy_kev <= ch2_energy_range[1]
     
-    return np.array(timing_diffs)
+    # Calculate timing differences
+    return np.subtract(ch1_timing_ns[keep], ch2_timing_ns[keep], dtype=np.float64)
 
 
 def get_channel_info(app: PositronApp, channel: str) -> Dict[str, Any]:
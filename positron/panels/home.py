@@ -15,6 +15,7 @@ from datetime import datetime
 from typing import Optional
 from pathlib import Path
 
+import numpy as np
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
     QPushButton, QLabel, QCheckBox, QSpinBox, QGroupBox,
@@ -27,7 +28,6 @@ from positron.app import PositronApp
 from positron.ui.waveform_plot import WaveformPlot
 from positron.scope.acquisition import create_acquisition_engine, WaveformBatch
 from positron.ui.trigger_dialog import show_trigger_config_dialog
-from positron.scope.trigger import create_trigger_configurator
 
 
 class HomePanel(QWidget):
@@ -73,8 +73,9 @@ class HomePanel(QWidget):
         self._stats_timer.timeout.connect(self._update_statistics_display)
         self._stats_timer.setInterval(100)  # Update 10 times per second
         
-        # Connect to app signals
-        self.app.config_changed.connect(self._on_config_changed)
+        # Connect to app signals. config_changed is emitted inside save_config(),
+        # which dialog and control handlers call mid-update, so refresh once they return
+        self.app.config_changed.connect(self._on_config_changed, Qt.QueuedConnection)
     
     def _setup_ui(self) -> None:
         """Create and layout all UI elements."""
@@ -529,17 +530,25 @@ class HomePanel(QWidget):
             writer.writerow(header)
             
             # Write data rows
-            # Create calibration lookup for efficient access
-            calibrations = {
-                'A': scope_config.calibration_a,
-                'B': scope_config.calibration_b,
-                'C': scope_config.calibration_c,
-                'D': scope_config.calibration_d
-            }
+            channels = ['A', 'B', 'C', 'D']
+            channel_calibrated = [calibrations[ch].calibrated for ch in channels]
+            
+            # Calibrate all channels of all events in one multiply-add
+            gains, offsets = scope_config.calibration_vector()
+            raw_energies = np.fromiter(
+                (
+                    pulse.energy if pulse else 0.0
+                    for event in events
+                    for pulse in (event.channels.get(ch) for ch in channels)
+                ),
+                dtype=np.float64,
+                count=len(events) * len(channels)
+            ).reshape(-1, len(channels))
+            energies_kev = (raw_energies * gains + offsets).tolist()
             
-            for event in events:
+            for event, event_energies_kev in zip(events, energies_kev):
                 row = []
-                for ch in ['A', 'B', 'C', 'D']:
+                for i, ch in enumerate(channels):
                     pulse = event.channels.get(ch)
                     if pulse:
                         # Has pulse flag
@@ -549,11 +558,8 @@ class HomePanel(QWidget):
                         row.append(f"{pulse.timing_ns:.6f}")
                         
                         # Energy (calibrated if available)
-                        calib = calibrations[ch]
-                        if calib and calib.calibrated:
-                            # Apply calibration
-                            energy_kev = calib.apply_calibration(pulse.energy)
-                            row.append(f"{energy_kev:.6f}")
+                        if channel_calibrated[i]:
+                            row.append(f"{event_energies_kev[i]:.6f}")
                         else:
                             # Not calibrated - write N/A
                             row.append('N/A')
@@ -719,7 +725,7 @@ class HomePanel(QWidget):
         
         # Apply trigger configuration to hardware BEFORE creating acquisition engine
         try:
-            trigger_configurator = create_trigger_configurator(scope_info)
+            trigger_configurator = self.app.get_trigger_configurator()
             trigger_configurator.apply_trigger(config.scope.trigger)
         except Exception as e:
             from PySide6.QtWidgets import QMessageBox
@@ -890,7 +896,7 @@ class HomePanel(QWidget):
             self.app.config.scope.trigger = new_config
             
             # Apply to scope
-            trigger_configurator = create_trigger_configurator(self.app.scope_info)
+            trigger_configurator = self.app.get_trigger_configurator()
             trigger_configurator.apply_trigger(new_config)
             
             # Save configuration
@@ -6,12 +6,21 @@ memory management and concurrent access support.
 """
 
 import sys
-from typing import List, Optional
+from typing import List, Optional, Tuple
+
+import numpy as np
 from PySide6.QtCore import QMutex, QMutexLocker
 
 from positron.processing.pulse import EventData
 
 
+# Row of each channel in the columnar arrays
+CHANNEL_ROWS = {'A': 0, 'B': 1, 'C': 2, 'D': 3}
+
+# Initial column capacity (grown by doubling up to max_capacity)
+_INITIAL_COLUMN_CAPACITY = 4096
+
+
 class EventStorage:
     """
     Thread-safe storage for event data.
@@ -19,11 +28,14 @@ class EventStorage:
     Supports concurrent access from acquisition thread (writes) and
     UI/analysis threads (reads). Uses Python list with mutex protection.
     
-    Current implementation: ~750 bytes per event
-    Default capacity: 1M events = ~700 MB memory
+    Alongside the EventData list, per-channel energy, timing and has_pulse
+    values are kept in columnar NumPy arrays of shape (4, capacity), rows
+    ordered as CHANNEL_ROWS. Histogram and timing analysis read these
+    directly instead of iterating EventData objects.
     
-    Note: Future optimization to NumPy structured arrays could reduce
-    memory to ~80 bytes/event, enabling 10M+ events in <1 GB.
+    Current implementation: ~750 bytes per event (+9 bytes per channel
+    for the columns)
+    Default capacity: 1M events = ~700 MB memory
     """
     
     def __init__(self, max_capacity: int = 1_000_000):
@@ -37,6 +49,8 @@ class EventStorage:
         self._mutex = QMutex()
         self._max_capacity = max_capacity
         self._event_id_counter = 0
+        self._generation = 0  # Incremented by clear()
+        self._allocate_columns(min(max_capacity, _INITIAL_COLUMN_CAPACITY))
     
     def add_event(self, event: EventData) -> bool:
         """
@@ -52,6 +66,7 @@ class EventStorage:
             if len(self._events) >= self._max_capacity:
                 return False
             
+            self._append_columns([event])
             self._events.append(event)
             return True
     
@@ -74,7 +89,9 @@ class EventStorage:
             
             # Add as many as we can
             num_to_add = min(len(events), available_space)
-            self._events.extend(events[:num_to_add])
+            to_add = events[:num_to_add]
+            self._append_columns(to_add)
+            self._events.extend(to_add)
             
             return num_to_add
     
@@ -105,6 +122,27 @@ class EventStorage:
             else:
                 return self._events[start_idx:end_idx].copy()
     
+    def get_columns(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Get the columnar event data for all stored events.
+        
+        The arrays are views, not copies. They stay valid after later
+        additions or clear(): rows already stored are never rewritten, and
+        growth and clear() move storage to new arrays.
+        
+        Returns:
+            Tuple of (energy, timing_ns, has_pulse), each of shape
+            (4, count) with rows ordered as CHANNEL_ROWS; energy and
+            timing_ns are float32, has_pulse is bool
+        """
+        with QMutexLocker(self._mutex):
+            count = len(self._events)
+            return (
+                self._energy[:, :count],
+                self._timing[:, :count],
+                self._has_pulse[:, :count],
+            )
+    
     def get_all_events(self) -> List[EventData]:
         """
         Get a copy of all events.
@@ -123,6 +161,20 @@ class EventStorage:
         with QMutexLocker(self._mutex):
             self._events.clear()
             self._event_id_counter = 0
+            self._generation += 1
+            
+            # Fresh arrays, so views handed out earlier are left untouched
+            self._allocate_columns(min(self._max_capacity, _INITIAL_COLUMN_CAPACITY))
+    
+    def get_generation(self) -> int:
+        """
+        Get the number of times storage has been cleared.
+        
+        Returns:
+            Clear counter (changes whenever indices are invalidated)
+        """
+        with QMutexLocker(self._mutex):
+            return self._generation
     
     def is_full(self) -> bool:
         """
@@ -144,6 +196,39 @@ class EventStorage:
         with QMutexLocker(self._mutex):
             return self._max_capacity - len(self._events)
     
+    def _allocate_columns(self, capacity: int) -> None:
+        """Allocate empty columnar arrays (caller holds the mutex or is __init__)."""
+        self._energy = np.zeros((4, capacity), dtype=np.float32)
+        self._timing = np.zeros((4, capacity), dtype=np.float32)
+        self._has_pulse = np.zeros((4, capacity), dtype=bool)
+    
+    def _append_columns(self, events: List[EventData]) -> None:
+        """
+        Write events into the columnar arrays after the stored events.
+        
+        Caller must hold the mutex and have checked capacity.
+        
+        Args:
+            events: Events about to be appended to the EventData list
+        """
+        start = len(self._events)
+        end = start + len(events)
+        
+        capacity = self._energy.shape[1]
+        if end > capacity:
+            new_capacity = min(self._max_capacity, max(end, capacity * 2))
+            energy, timing, has_pulse = self._energy, self._timing, self._has_pulse
+            self._allocate_columns(new_capacity)
+            self._energy[:, :start] = energy[:, :start]
+            self._timing[:, :start] = timing[:, :start]
+            self._has_pulse[:, :start] = has_pulse[:, :start]
+        
+        for channel, row in CHANNEL_ROWS.items():
+            pulses = [event.channels.get(channel) for event in events]
+            self._energy[row, start:end] = [p.energy if p is not None else 0.0 for p in pulses]
+            self._timing[row, start:end] = [p.timing_ns if p is not None else 0.0 for p in pulses]
+            self._has_pulse[row, start:end] = [p is not None and p.has_pulse for p in pulses]
+    
     def get_memory_usage(self) -> float:
         """
         Estimate memory usage in megabytes.
@@ -168,6 +253,7 @@ class EventStorage:
             bytes_per_event = 500
             
             total_bytes = count * bytes_per_event
+            total_bytes += self._energy.nbytes + self._timing.nbytes + self._has_pulse.nbytes
             total_mb = total_bytes / (1024 * 1024)
             
             return total_mb
@@ -49,7 +49,8 @@ class ScopeConnection:
         """
         Automatically detect and connect to a PicoScope device.
         
-        Tries PS6000 series first, then PS3000a series.
+        Tries PS6000 series first, then PS3000a series. A device that is
+        already connected is returned as-is without enumerating the bus again.
         
         Returns:
             ScopeInfo: Information about the connected device
@@ -58,6 +59,10 @@ class ScopeConnection:
             DeviceNotFoundError: If no compatible device is found
             PicoSDKCtypesError: If there's an error communicating with the device
         """
+        # Reuse the open handle rather than opening the unit a second time
+        if self._scope_info is not None:
+            return self._scope_info
+        
         # Try PS6000 first (6402D)
         try:
             scope_info = self._connect_ps6000()
@@ -0,0 +1,369 @@
+"""
+Startup sequence for Positron.
+
+StartupController runs the connect -> configure -> trigger -> main window
+pipeline as a chain of Qt slots. Error dialogs are shown with
+QMessageBox.open() and report back through their finished signal, so no
+step ever spins a nested event loop with exec().
+
+This is driven from main.py once the QApplication exists.
+"""
+
+import os
+import sys
+import traceback
+from typing import TYPE_CHECKING, Callable, Optional
+
+from PySide6.QtWidgets import QApplication, QMessageBox
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Qt, QTimer, Signal
+
+if TYPE_CHECKING:
+    from positron.app import PositronApp
+    from positron.scope.connection import ScopeInfo
+
+
+class _ApplyTriggerTaskSignals(QObject):
+    """Signals for ApplyTriggerTask (QRunnable is not a QObject)."""
+    finished = Signal()
+
+
+class ApplyTriggerTask(QRunnable):
+    """
+    Applies a trigger configuration on a worker thread.
+    
+    The outcome is stored on the task (result or error) and announced with
+    signals.finished, which is delivered on the GUI thread.
+    """
+    
+    def __init__(self, trigger_configurator, trigger_config):
+        """
+        Initialize the task.
+        
+        Args:
+            trigger_configurator: Configurator for the connected scope
+            trigger_config: TriggerConfig to apply
+        """
+        super().__init__()
+        # The controller reads the outcome after the finished signal
+        self.setAutoDelete(False)
+        
+        self.signals = _ApplyTriggerTaskSignals()
+        self._trigger_configurator = trigger_configurator
+        self._trigger_config = trigger_config
+        self.result = None
+        self.error: Optional[Exception] = None
+    
+    def run(self) -> None:
+        """Apply the trigger, capturing the applied info or the exception."""
+        try:
+            self.result = self._trigger_configurator.apply_trigger(self._trigger_config)
+        except Exception as e:
+            self.error = e
+        self.signals.finished.emit()
+
+
+class StartupController(QObject):
+    """
+    Drives application startup without blocking the Qt event loop.
+    
+    Each step either moves on to the next step or opens a dialog whose
+    finished signal decides between retrying, aborting and continuing.
+    Hardware and UI modules (picosdk, the configurators, the main window)
+    are imported by the step that first needs them, so the first dialog can
+    appear before they are loaded.
+    
+    The trigger is applied on a worker thread while the main window is
+    being constructed, since neither depends on the other.
+    
+    Aborting exits the event loop with the same status codes main() used
+    to return (0 when the user cancels after no device was found, 1 for
+    any failure).
+    """
+    
+    def __init__(self, parent: Optional[QObject] = None, debug_dialogs: bool = False):
+        """
+        Initialize the startup controller.
+        
+        Args:
+            parent: Optional parent QObject
+            debug_dialogs: Also show the startup summary in a dialog once the
+                main window is up (the status bar always shows it)
+        """
+        super().__init__(parent)
+        
+        # Set POSITRON_VERBOSE=1 to print the startup summary for log consumers
+        self._verbose = bool(os.environ.get("POSITRON_VERBOSE"))
+        self._debug_dialogs = debug_dialogs
+        
+        self.positron_app: Optional['PositronApp'] = None
+        self.main_window = None
+        self._scope_info: Optional['ScopeInfo'] = None
+        self._timebase_info = None
+        self._trigger_info = None
+        self._dialog: Optional[QMessageBox] = None
+        self._trigger_task: Optional[ApplyTriggerTask] = None
+        self._pending_main_window = None
+        self._main_window_error: Optional[Exception] = None
+    
+    def start(self) -> None:
+        """Schedule the startup sequence to run once the event loop is running."""
+        # Dialogs are the only windows until the main window appears, so closing
+        # one must not be treated as the last window closing
+        QApplication.instance().setQuitOnLastWindowClosed(False)
+        QTimer.singleShot(0, self._connect)
+    
+    def _connect(self) -> None:
+        """Detect and connect to a PicoScope."""
+        from picosdk.errors import DeviceNotFoundError
+        from positron.scope.connection import detect_and_connect
+        
+        try:
+            self._scope_info = detect_and_connect()
+        
+        except DeviceNotFoundError as e:
+            self._show_dialog(
+                QMessageBox.Warning,
+                "PicoScope Not Found",
+                "No PicoScope device detected.",
+                str(e),
+                QMessageBox.Retry | QMessageBox.Cancel,
+                lambda result: self._on_connect_result(result, cancel_code=0)
+            )
+            return
+        
+        except Exception as e:
+            self._show_dialog(
+                QMessageBox.Critical,
+                "Connection Error",
+                "An unexpected error occurred while connecting to the PicoScope.",
+                str(e),
+                QMessageBox.Retry | QMessageBox.Cancel,
+                lambda result: self._on_connect_result(result, cancel_code=1)
+            )
+            return
+        
+        self._configure()
+    
+    def _on_connect_result(self, result: int, cancel_code: int) -> None:
+        """Handle the Retry/Cancel choice from a connection error dialog."""
+        if result == QMessageBox.Cancel:
+            self._finish(cancel_code)
+        else:
+            self._connect()
+    
+    def _configure(self) -> None:
+        """Create the application state, then apply the scope and trigger configuration."""
+        try:
+            from positron.app import PositronApp
+            
+            # Create Positron application instance
+            self.positron_app = PositronApp()
+        except Exception as e:
+            self._fail(e)
+            return
+        
+        # connect_scope() and the configuration step both update the config;
+        # write it to disk once when this block exits
+        with self.positron_app.defer_saves():
+            try:
+                # Register the scope connection
+                self.positron_app.connect_scope(self._scope_info)
+            except Exception as e:
+                self._fail(e)
+                return
+            
+            if not self._apply_scope_configuration():
+                return
+        
+        self._apply_trigger_and_show_main_window()
+    
+    def _apply_scope_configuration(self) -> bool:
+        """
+        Apply the saved scope configuration (Phase 1.3).
+        
+        Returns:
+            True on success, False if an error dialog was opened
+        """
+        try:
+            configurator = self.positron_app.get_configurator()
+            configurator.apply_configuration()
+            
+            # Store achieved values in config
+            sample_rate = configurator.get_actual_sample_rate()
+            total_samples, pre_samples = configurator.get_sample_counts()
+            voltage_range_code = configurator.get_voltage_range_code()
+            timebase_info = configurator.get_timebase_info()
+            
+            scope_config = self.positron_app.config.scope
+            scope_config.sample_rate = sample_rate
+            scope_config.waveform_length = total_samples
+            scope_config.pre_trigger_samples = pre_samples
+            scope_config.voltage_range_code = voltage_range_code
+            scope_config.timebase_index = timebase_info.timebase_index
+            self.positron_app.save_config()
+            self._timebase_info = timebase_info
+        
+        except Exception as e:
+            self._show_dialog(
+                QMessageBox.Critical,
+                "Configuration Error",
+                "Failed to configure the oscilloscope.",
+                str(e),
+                QMessageBox.Ok,
+                self._on_setup_error_closed
+            )
+            return False
+        
+        return True
+    
+    def _apply_trigger_and_show_main_window(self) -> None:
+        """
+        Apply the saved trigger (Phase 1.4) while the main window is built (Phase 2).
+        
+        The trigger round trip runs on the global thread pool; the window is
+        constructed hidden on the GUI thread in the meantime. Startup carries
+        on in _on_trigger_applied, which is queued to the GUI thread and so
+        always runs after the window has been built.
+        """
+        try:
+            trigger_configurator = self.positron_app.get_trigger_configurator()
+        except Exception as e:
+            self._show_trigger_error(e)
+            return
+        
+        task = ApplyTriggerTask(trigger_configurator, self.positron_app.config.scope.trigger)
+        task.signals.finished.connect(self._on_trigger_applied)
+        self._trigger_task = task
+        QThreadPool.globalInstance().start(task)
+        
+        try:
+            from positron.ui.main_window import MainWindow
+            
+            self._pending_main_window = MainWindow(self.positron_app)
+        except Exception as e:
+            # Reported once the trigger call has returned and the scope is idle
+            self._main_window_error = e
+    
+    def _on_trigger_applied(self) -> None:
+        """Show the main window once the trigger is applied, or report the failure."""
+        task = self._trigger_task
+        main_window = self._pending_main_window
+        window_error = self._main_window_error
+        self._trigger_task = None
+        self._pending_main_window = None
+        self._main_window_error = None
+        
+        if window_error is not None:
+            self._fail(window_error)
+            return
+        
+        if task.error is not None:
+            main_window.deleteLater()
+            self._show_trigger_error(task.error)
+            return
+        
+        self._trigger_info = task.result
+        summary = self._build_startup_summary()
+        self.main_window = main_window
+        self.main_window.set_startup_summary(summary)
+        self.main_window.show()
+        
+        QApplication.instance().setQuitOnLastWindowClosed(True)
+        
+        if self._verbose:
+            print(f"Startup complete: {summary}")
+        if self._debug_dialogs:
+            self._show_dialog(
+                QMessageBox.Information,
+                "Startup Complete",
+                "Scope connected and configured.",
+                summary,
+                QMessageBox.Ok,
+                lambda result: None
+            )
+    
+    def _show_trigger_error(self, error: Exception) -> None:
+        """Report a trigger configuration failure; closing the dialog exits."""
+        self._show_dialog(
+            QMessageBox.Critical,
+            "Trigger Configuration Error",
+            "Failed to configure the trigger.",
+            str(error),
+            QMessageBox.Ok,
+            self._on_setup_error_closed
+        )
+    
+    def _on_setup_error_closed(self, result: int) -> None:
+        """Clean up after a configuration or trigger failure and exit."""
+        self.positron_app.disconnect_scope()
+        self._finish(1)
+    
+    def _build_startup_summary(self) -> str:
+        """
+        Summarize the connected scope and applied settings for the status bar.
+        
+        Returns:
+            One-line summary of scope, timebase and trigger
+        """
+        scope = self._scope_info
+        timebase = self._timebase_info
+        trigger = self._trigger_info
+        
+        parts = [f"Connected: {scope.variant} ({scope.serial})"]
+        if timebase is not None:
+            parts.append(
+                f"{timebase.sample_rate_hz / 1e6:.0f} MS/s, {timebase.total_samples} samples "
+                f"({timebase.pre_trigger_samples} pre-trigger)"
+            )
+        if trigger is not None:
+            conditions = "; ".join(trigger.conditions_summary) or "no conditions"
+            parts.append(f"Trigger: {conditions}, {trigger.threshold_mv:g} mV {trigger.direction.lower()}")
+        return "  |  ".join(parts)
+    
+    def _show_dialog(
+        self,
+        icon: QMessageBox.Icon,
+        title: str,
+        text: str,
+        informative_text: str,
+        buttons: QMessageBox.StandardButton,
+        on_finished: Callable[[int], None]
+    ) -> None:
+        """
+        Open a window-modal message box and route its result to a callback.
+        
+        Args:
+            icon: Message box icon
+            title: Window title
+            text: Main message
+            informative_text: Detail text (usually the exception message)
+            buttons: Standard buttons to offer (Retry is the default when present)
+            on_finished: Called with the clicked standard button
+        """
+        msg = QMessageBox()
+        msg.setAttribute(Qt.WA_DeleteOnClose)
+        msg.setIcon(icon)
+        msg.setWindowTitle(title)
+        msg.setText(text)
+        msg.setInformativeText(informative_text)
+        msg.setStandardButtons(buttons)
+        if buttons & QMessageBox.Retry:
+            msg.setDefaultButton(QMessageBox.Retry)
+        msg.finished.connect(on_finished)
+        
+        # Keep a reference until the dialog closes (it has no parent yet)
+        self._dialog = msg
+        msg.open()
+    
+    def _fail(self, error: Exception) -> None:
+        """Report an unexpected startup failure and exit with status 1."""
+        # Emit the message and traceback as one write rather than line by line
+        details = "".join(traceback.format_exception(type(error), error, error.__traceback__))
+        sys.stderr.write(f"Error starting application: {error}\n{details}")
+        sys.stderr.flush()
+        self._finish(1)
+    
+    def _finish(self, exit_code: int) -> None:
+        """Abort startup and leave the event loop with the given status."""
+        self._dialog = None
+        QApplication.instance().exit(exit_code)
@@ -346,7 +346,7 @@ def show_energy_display_help(parent=None):
     <h3>4. Binning Options</h3>
     <p><b>Automatic Mode (Default):</b></p>
     <ul>
-        <li>1000 bins with auto-ranging based on data</li>
+        <li>Up to 1000 bins (about one per pixel of plot width) with auto-ranging based on data</li>
         <li>Updates automatically as data is acquired</li>
         <li>Good for most applications</li>
     </ul>
@@ -32,16 +32,19 @@ class MainWindow(QMainWindow):
     - Future: Calibration panel, Analysis panels
     """
     
-    def __init__(self, app: PositronApp):
+    def __init__(self, app: PositronApp, startup_summary: Optional[str] = None):
         """
         Initialize the main window.
         
         Args:
             app: Positron application instance
+            startup_summary: Optional connection/configuration summary shown
+                on the status bar when the window first appears
         """
         super().__init__()
         
         self.app = app
+        self._startup_summary = startup_summary
         
         # Setup window
         self._setup_window()
@@ -155,6 +158,23 @@ class MainWindow(QMainWindow):
             f"{scope_info}"
         )
     
+    def set_startup_summary(self, summary: Optional[str]) -> None:
+        """
+        Set the summary shown on the status bar when the window first appears.
+        
+        Args:
+            summary: Connection/configuration summary, or None for no message
+        """
+        self._startup_summary = summary
+    
+    def showEvent(self, event) -> None:
+        """Show the startup summary on the status bar the first time the window appears."""
+        super().showEvent(event)
+        
+        if self._startup_summary:
+            self.statusBar().showMessage(self._startup_summary, 15000)
+            self._startup_summary = None
+    
     def closeEvent(self, event) -> None:
         """
         Handle window close event.
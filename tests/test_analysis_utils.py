@@ -0,0 +1,165 @@
+"""
+Unit tests for analysis panel helpers.
+
+Tests the uniform-bin histogram used by the Energy and Timing Display panels
+and the timing-difference extraction.
+"""
+
+import numpy as np
+import pytest
+
+import positron.panels.analysis.utils
+from positron.config import ChannelCalibration
+from positron.panels.analysis.utils import (
+    calculate_timing_differences,
+    calculate_timing_differences_columns,
+    uniform_histogram
+)
+from positron.processing.events import EventStorage
+from positron.processing.pulse import ChannelPulse, EventData
+
+
+def test_uniform_histogram_matches_numpy():
+    """Test that counts agree with np.histogram for in- and out-of-range data."""
+    rng = np.random.default_rng(0)
+    values = rng.uniform(-100.0, 2100.0, 200_000).astype(np.float32)
+    
+    counts = uniform_histogram(values, 1000, (0.0, 1500.0))
+    
+    expected, _ = np.histogram(values, bins=1000, range=(0.0, 1500.0))
+    np.testing.assert_array_equal(counts, expected)
+
+
+def test_uniform_histogram_edges():
+    """Test that the upper edge is counted in the last bin and outliers are dropped."""
+    values = np.array([-0.1, 0.0, 0.5, 1.0, 9.99, 10.0, 10.1])
+    
+    counts = uniform_histogram(values, 10, (0.0, 10.0))
+    
+    assert counts.tolist() == [2, 1, 0, 0, 0, 0, 0, 0, 0, 2]
+
+
+def test_uniform_histogram_empty():
+    """Test that no values gives all-zero counts of the requested length."""
+    counts = uniform_histogram(np.array([], dtype=np.float32), 5, (0.0, 1.0))
+    
+    assert counts.tolist() == [0, 0, 0, 0, 0]
+
+
+def test_uniform_histogram_without_fast_histogram(monkeypatch):
+    """Test the np.bincount fallback used when fast-histogram is not installed."""
+    monkeypatch.setattr(positron.panels.analysis.utils, "histogram1d", None)
+    values = np.array([-0.1, 0.0, 0.5, 1.0, 9.99, 10.0, 10.1])
+    
+    counts = uniform_histogram(values, 10, (0.0, 10.0))
+    
+    assert counts.tolist() == [2, 1, 0, 0, 0, 0, 0, 0, 0, 2]
+
+
+def test_uniform_histogram_values_in_range():
+    """Test that skipping the range filter gives the same counts for data spanning the range."""
+    rng = np.random.default_rng(2)
+    values = rng.normal(0.0, 5.0, 10_000)
+    value_range = (float(values.min()), float(values.max()))
+    
+    counts = uniform_histogram(values, 500, value_range, values_in_range=True)
+    
+    np.testing.assert_array_equal(counts, uniform_histogram(values, 500, value_range))
+    assert counts.sum() == values.size
+
+
+def test_uniform_histogram_rejects_empty_range():
+    """Test that a zero-width or reversed range raises ValueError."""
+    with pytest.raises(ValueError):
+        uniform_histogram(np.array([1.0]), 10, (1.0, 1.0))
+    with pytest.raises(ValueError):
+        uniform_histogram(np.array([1.0]), 10, (2.0, 1.0))
+
+
+def _timing_reference(events, ch1, ch2, calib1, calib2, range1, range2):
+    """Per-event timing differences computed with the scalar calibration."""
+    diffs = []
+    for event in events:
+        pulse1 = event.channels.get(ch1)
+        pulse2 = event.channels.get(ch2)
+        if not (pulse1 and pulse1.has_pulse and pulse2 and pulse2.has_pulse):
+            continue
+        if not range1[0] <= calib1.apply_calibration(pulse1.energy) <= range1[1]:
+            continue
+        if not range2[0] <= calib2.apply_calibration(pulse2.energy) <= range2[1]:
+            continue
+        diffs.append(pulse1.timing_ns - pulse2.timing_ns)
+    return diffs
+
+
+def _random_events(rng, count):
+    """Create events with random pulses on a random subset of channels A-C."""
+    events = []
+    for i in range(count):
+        channels = {
+            ch: ChannelPulse(
+                timing_ns=float(rng.uniform(0.0, 200.0)),
+                energy=float(rng.uniform(0.0, 4000.0)),
+                peak_mv=1.0,
+                has_pulse=bool(rng.random() > 0.2)
+            )
+            for ch in 'ABC'
+            if rng.random() > 0.1
+        }
+        events.append(EventData(event_id=i, timestamp=0.0, channels=channels))
+    return events
+
+
+def test_calculate_timing_differences_matches_per_event():
+    """Test that pulse, energy-window and missing-channel filtering match the per-event rules."""
+    events = _random_events(np.random.default_rng(0), 500)
+    calib1 = ChannelCalibration(gain=0.5, offset=-3.0, calibrated=True)
+    calib2 = ChannelCalibration(gain=0.25, offset=10.0, calibrated=True)
+    
+    diffs = calculate_timing_differences(events, 'B', 'A', calib1, calib2, (100.0, 1500.0), (0.0, 600.0))
+    
+    expected = _timing_reference(events, 'B', 'A', calib1, calib2, (100.0, 1500.0), (0.0, 600.0))
+    assert len(expected) > 0
+    np.testing.assert_array_equal(diffs, expected)
+
+
+def test_calculate_timing_differences_no_pairs():
+    """Test that no coincident pulses or an uncalibrated channel gives an empty array."""
+    calibration = ChannelCalibration(gain=1.0, offset=0.0, calibrated=True)
+    events = [
+        EventData(
+            event_id=0,
+            timestamp=0.0,
+            channels={'A': ChannelPulse(timing_ns=1.0, energy=10.0, peak_mv=1.0, has_pulse=True)}
+        )
+    ]
+    
+    assert calculate_timing_differences(events, 'A', 'B', calibration, calibration, (0, 100), (0, 100)).size == 0
+    assert calculate_timing_differences(
+        events, 'A', 'A', calibration, ChannelCalibration(), (0, 100), (0, 100)
+    ).size == 0
+
+
+def test_calculate_timing_differences_columns_matches_events():
+    """Test that the columnar version selects the same events as the event-list version."""
+    events = _random_events(np.random.default_rng(1), 500)
+    storage = EventStorage()
+    storage.add_events(events)
+    calib1 = ChannelCalibration(gain=0.5, offset=-3.0, calibrated=True)
+    calib2 = ChannelCalibration(gain=0.25, offset=10.0, calibrated=True)
+    
+    energy, timing_ns, has_pulse = storage.get_columns()
+    
+    diffs = calculate_timing_differences_columns(
+        calib1.apply_calibration_array(energy[2]), timing_ns[2], has_pulse[2],
+        calib2.apply_calibration_array(energy[1]), timing_ns[1], has_pulse[1],
+        (100.0, 1500.0), (0.0, 600.0)
+    )
+    
+    expected = calculate_timing_differences(
+        events, 'C', 'B', calib1, calib2, (100.0, 1500.0), (0.0, 600.0)
+    )
+    assert diffs.dtype == np.float64
+    assert len(expected) > 0
+    # Columns store times as float32
+    np.testing.assert_allclose(diffs, expected, atol=1e-4)
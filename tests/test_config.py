@@ -0,0 +1,180 @@
+"""
+Unit tests for configuration module.
+
+Tests JSON save/load round-tripping and the cached parse used by AppConfig.load.
+"""
+
+import numpy as np
+import pytest
+
+import positron.config
+from positron.config import AppConfig, ChannelCalibration
+
+
+def test_load_missing_file(tmp_path):
+    """Test that a missing config file gives the defaults."""
+    config = AppConfig.load(tmp_path / "config.json")
+    
+    assert config.scope.scope_series is None
+    assert config.cfd_fraction == 0.5
+
+
+def test_save_load_round_trip(tmp_path):
+    """Test that saved values are restored by load."""
+    path = tmp_path / "config.json"
+    
+    config = AppConfig()
+    config.scope.scope_series = "3000a"
+    config.scope.calibration_b = ChannelCalibration(gain=0.5, offset=-3.0, calibrated=True)
+    config.scope.trigger.condition_2.enabled = True
+    config.scope.trigger.condition_2.channels = ['B', 'C']
+    config.cfd_fraction = 0.3
+    config.save(path)
+    
+    loaded = AppConfig.load(path)
+    assert loaded.scope.scope_series == "3000a"
+    assert loaded.scope.calibration_b.gain == 0.5
+    assert loaded.scope.calibration_b.offset == -3.0
+    assert loaded.scope.calibration_b.calibrated
+    assert loaded.scope.trigger.condition_2.channels == ['B', 'C']
+    assert loaded.cfd_fraction == 0.3
+
+
+def test_save_numpy_values(tmp_path):
+    """Test that NumPy scalars from calibration/configuration code can be saved."""
+    path = tmp_path / "config.json"
+    
+    config = AppConfig()
+    config.scope.sample_rate = np.float64(125e6)
+    config.scope.calibration_a.gain = np.float64(1.5)
+    config.save(path)
+    
+    loaded = AppConfig.load(path)
+    assert loaded.scope.sample_rate == 125e6
+    assert loaded.scope.calibration_a.gain == 1.5
+
+
+def test_round_trip_without_orjson(tmp_path, monkeypatch):
+    """Test the stdlib json fallback used when orjson is not installed."""
+    monkeypatch.setattr(positron.config, "orjson", None)
+    path = tmp_path / "config.json"
+    
+    config = AppConfig()
+    config.scope.calibration_c.gain = 0.25
+    config.save(path)
+    
+    assert AppConfig.load(path).scope.calibration_c.gain == 0.25
+
+
+def test_repeated_loads_are_independent(tmp_path):
+    """Test that configs loaded from the same cached parse share no state."""
+    path = tmp_path / "config.json"
+    AppConfig().save(path)
+    
+    first = AppConfig.load(path)
+    second = AppConfig.load(path)
+    first.scope.trigger.condition_1.channels.append('D')
+    first.scope.calibration_a.gain = 2.0
+    
+    assert second.scope.trigger.condition_1.channels == ['A']
+    assert second.scope.calibration_a.gain == 1.0
+
+
+def test_load_after_save_sees_new_values(tmp_path):
+    """Test that saving invalidates the cached parse."""
+    path = tmp_path / "config.json"
+    config = AppConfig()
+    config.save(path)
+    AppConfig.load(path)
+    
+    config.max_events = 1234
+    config.save(path)
+    
+    assert AppConfig.load(path).max_events == 1234
+
+
+def test_apply_calibration_array_matches_scalar():
+    """Test that array calibration agrees with the scalar method element-wise."""
+    calibration = ChannelCalibration(gain=0.25, offset=-4.0, calibrated=True)
+    raw = np.array([0.0, 100.0, 2044.0, 5100.0])
+    
+    result = calibration.apply_calibration_array(raw)
+    
+    expected = [calibration.apply_calibration(x) for x in raw]
+    np.testing.assert_allclose(result, expected)
+    assert result is not raw
+    np.testing.assert_array_equal(raw, [0.0, 100.0, 2044.0, 5100.0])
+
+
+def test_apply_calibration_array_integer_input():
+    """Test that integer raw values are promoted to float32 rather than truncated."""
+    calibration = ChannelCalibration(gain=0.5, offset=0.25)
+    
+    result = calibration.apply_calibration_array(np.array([1, 3], dtype=np.int16))
+    
+    assert result.dtype == np.float32
+    np.testing.assert_allclose(result, [0.75, 1.75])
+
+
+def test_apply_calibration_array_keeps_float_precision():
+    """Test that float32 input stays float32 and float64 input stays float64."""
+    calibration = ChannelCalibration(gain=0.5, offset=0.25)
+    
+    assert calibration.apply_calibration_array(np.ones(3, dtype=np.float32)).dtype == np.float32
+    assert calibration.apply_calibration_array(np.ones(3)).dtype == np.float64
+
+
+def test_apply_calibration_array_in_place():
+    """Test that passing out=raw calibrates the array in place."""
+    calibration = ChannelCalibration(gain=2.0, offset=1.0)
+    raw = np.array([0.0, 1.5, 3.0], dtype=np.float32)
+    
+    result = calibration.apply_calibration_array(raw, out=raw)
+    
+    assert result is raw
+    np.testing.assert_array_equal(raw, [1.0, 4.0, 7.0])
+
+
+def test_get_calibration_by_channel():
+    """Test channel lookup, including lower case and invalid names."""
+    scope = AppConfig().scope
+    
+    assert scope.get_calibration('A') is scope.calibration_a
+    assert scope.get_calibration('d') is scope.calibration_d
+    with pytest.raises(ValueError):
+        scope.get_calibration('E')
+
+
+def test_get_calibration_after_reassignment():
+    """Test that replacing a calibration object is seen by get_calibration."""
+    scope = AppConfig().scope
+    replacement = ChannelCalibration(gain=2.0, calibrated=True)
+    
+    scope.calibration_c = replacement
+    
+    assert scope.get_calibration('C') is replacement
+
+
+def test_save_replaces_file_atomically(tmp_path):
+    """Test that save overwrites an existing file and leaves no temporary file."""
+    path = tmp_path / "config.json"
+    path.write_text("not json")
+    
+    config = AppConfig()
+    config.cfd_fraction = 0.4
+    config.save(path)
+    
+    assert AppConfig.load(path).cfd_fraction == 0.4
+    assert [p.name for p in tmp_path.iterdir()] == ["config.json"]
+
+
+def test_calibration_vector():
+    """Test that the gain/offset snapshot is ordered A-D and reflects in-place updates."""
+    scope = AppConfig().scope
+    scope.calibration_b = ChannelCalibration(gain=2.0, offset=-1.0)
+    scope.calibration_d.gain = 0.5
+    
+    gains, offsets = scope.calibration_vector()
+    
+    np.testing.assert_array_equal(gains, [1.0, 2.0, 1.0, 0.5])
+    np.testing.assert_array_equal(offsets, [0.0, -1.0, 0.0, 0.0])
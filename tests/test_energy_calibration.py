@@ -0,0 +1,113 @@
+"""
+Unit tests for energy calibration module.
+
+Tests two-point calibration and centroid peak finding.
+"""
+
+import numpy as np
+import pytest
+
+from positron.calibration.energy import (
+    CalibrationError,
+    PEAK_1_KEV,
+    PEAK_2_KEV,
+    apply_calibration,
+    calculate_two_point_calibration,
+    calculate_two_point_calibration_batch,
+    find_peak_center_weighted_mean,
+    validate_calibration_data,
+)
+
+
+def test_two_point_calibration():
+    """Test that the fitted line maps both peaks to their known energies."""
+    gain, offset = calculate_two_point_calibration(100.0, 250.0)
+    
+    assert abs(apply_calibration(100.0, gain, offset) - PEAK_1_KEV) < 1e-6
+    assert abs(apply_calibration(250.0, gain, offset) - PEAK_2_KEV) < 1e-6
+
+
+def test_two_point_calibration_rejects_bad_peaks():
+    """Test that reversed or too-close peaks are rejected."""
+    with pytest.raises(CalibrationError):
+        calculate_two_point_calibration(250.0, 100.0)
+    
+    with pytest.raises(CalibrationError):
+        calculate_two_point_calibration(100.0, 105.0)
+
+
+def test_validate_calibration_data():
+    """Test validation messages for common selection mistakes."""
+    assert validate_calibration_data(1000, 100.0, 250.0) == (True, None)
+    
+    is_valid, message = validate_calibration_data(50, 100.0, 250.0)
+    assert not is_valid and "at least 100 events" in message
+    
+    is_valid, message = validate_calibration_data(1000, 100.0, 100.005)
+    assert not is_valid and "too similar" in message
+    
+    is_valid, message = validate_calibration_data(1000, 250.0, 100.0)
+    assert not is_valid and "higher energy" in message
+    
+    is_valid, message = validate_calibration_data(1000, 100.0, 600.0)
+    assert not is_valid and "~2.50" in message
+
+
+def test_two_point_calibration_batch():
+    """Test that the batch version matches per-channel calibration."""
+    peak_1 = np.array([100.0, 80.0, 120.0, 95.0])
+    peak_2 = np.array([250.0, 210.0, 300.0, 240.0])
+    
+    gains, offsets = calculate_two_point_calibration_batch(peak_1, peak_2)
+    
+    for i in range(4):
+        gain, offset = calculate_two_point_calibration(peak_1[i], peak_2[i])
+        assert abs(gains[i] - gain) < 1e-12
+        assert abs(offsets[i] - offset) < 1e-12
+    
+    with pytest.raises(CalibrationError):
+        calculate_two_point_calibration_batch(peak_1, np.array([250.0, 70.0, 300.0, 240.0]))
+
+
+def test_find_peak_center_weighted_mean():
+    """Test centroid against a histogram-based reference."""
+    rng = np.random.default_rng(1)
+    energies = np.concatenate([
+        rng.normal(120.0, 5.0, 5000),
+        rng.uniform(0.0, 400.0, 2000),
+    ])
+    region_min, region_max = 100.0, 140.0
+    
+    center = find_peak_center_weighted_mean(energies, region_min, region_max, num_bins=100)
+    
+    # Reference: centroid of np.histogram over the same region
+    in_region = (energies >= region_min) & (energies <= region_max)
+    hist, edges = np.histogram(energies[in_region], bins=100, range=(region_min, region_max))
+    centers = (edges[:-1] + edges[1:]) / 2
+    expected = np.sum(centers * hist) / np.sum(hist)
+    
+    assert abs(center - expected) < 0.05
+    assert abs(center - 120.0) < 1.0
+
+
+def test_find_peak_center_includes_region_edges():
+    """Test that values exactly on the region bounds are counted."""
+    energies = np.array([10.0] * 10 + [20.0] * 10)
+    
+    center = find_peak_center_weighted_mean(energies, 10.0, 20.0, num_bins=10)
+    
+    assert abs(center - 15.0) < 0.01
+
+
+def test_find_peak_center_errors():
+    """Test error handling for invalid or sparse regions."""
+    energies = np.linspace(0.0, 100.0, 50)
+    
+    with pytest.raises(CalibrationError):
+        find_peak_center_weighted_mean(energies, 50.0, 40.0)
+    
+    with pytest.raises(CalibrationError):
+        find_peak_center_weighted_mean(energies, 200.0, 300.0)
+    
+    with pytest.raises(CalibrationError):
+        find_peak_center_weighted_mean(energies, 10.0, 12.0)
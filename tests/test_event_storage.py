@@ -0,0 +1,61 @@
+"""
+Unit tests for event storage.
+
+Tests the incremental read API used by the analysis panels.
+"""
+
+import numpy as np
+
+from positron.processing.events import EventStorage
+from positron.processing.pulse import ChannelPulse, EventData
+
+
+def _make_events(count, start=0):
+    """Create events with a single pulse on channel A."""
+    return [
+        EventData(
+            event_id=start + i,
+            timestamp=0.0,
+            channels={'A': ChannelPulse(timing_ns=0.0, energy=float(start + i), peak_mv=1.0, has_pulse=True)}
+        )
+        for i in range(count)
+    ]
+
+
+def test_clear_changes_generation():
+    """Test that clear() is visible to incremental readers via the generation counter."""
+    storage = EventStorage()
+    storage.add_events(_make_events(3))
+    generation = storage.get_generation()
+    
+    storage.clear()
+    
+    assert storage.get_generation() != generation
+    assert storage.get_count() == 0
+
+
+def test_columns_match_events_across_growth():
+    """Test that the columnar arrays track stored events past the initial allocation."""
+    storage = EventStorage(max_capacity=10_000)
+    storage.add_events(_make_events(5000))
+    storage.add_event(_make_events(1, start=5000)[0])
+    
+    energy, timing, has_pulse = storage.get_columns()
+    
+    assert energy.shape == (4, 5001)
+    assert energy.dtype == np.float32
+    np.testing.assert_array_equal(energy[0], np.arange(5001, dtype=np.float32))
+    assert has_pulse[0].all()
+    assert not has_pulse[1:].any()  # Channels B-D have no ChannelPulse
+
+
+def test_clear_leaves_previous_views_intact():
+    """Test that arrays returned before clear() are not overwritten by new events."""
+    storage = EventStorage()
+    storage.add_events(_make_events(3))
+    energy, _, _ = storage.get_columns()
+    
+    storage.clear()
+    storage.add_events(_make_events(3, start=100))
+    
+    np.testing.assert_array_equal(energy[0], [0, 1, 2])